@@ -1,7 +1,9 @@
 import pickle
 import logging
+import weakref
 import numpy as np
 import pandas as pd
+from scipy import sparse
 from collections import Counter
 from typing import Union, Sequence, Optional, List, Any
 from sklearn.base import BaseEstimator
@@ -43,6 +45,12 @@ class SklearnScorer(BeliefScorer):
         model: BaseEstimator,
     ):
         self.model = model
+        # Cache of the most recent DataFrame-to-matrix conversion, as a
+        # (weakref to the DataFrame, matrix) tuple; see `to_matrix`
+        self._df_matrix_cache = None
+        # Cache of the most recent predict_proba result, as a (weakref
+        # to the feature matrix, probabilities) tuple; see `predict_proba`
+        self._proba_cache = None
 
     def check_prior_probs(
         self,
@@ -62,7 +70,7 @@ class SklearnScorer(BeliefScorer):
         self,
         stmts: Sequence[Statement],
         extra_evidence: Optional[List[List[Evidence]]] = None,
-    ) -> np.ndarray:
+    ) -> Union[np.ndarray, sparse.csr_matrix]:
         """Convert a list of Statements to a feature matrix."""
         raise NotImplementedError('Need to implement the stmts_to_matrix '
                                   'method')
@@ -70,15 +78,16 @@ class SklearnScorer(BeliefScorer):
     def df_to_matrix(
         self,
         df: pd.DataFrame,
-    ) -> np.ndarray:
+    ) -> Union[np.ndarray, sparse.csr_matrix]:
         """Convert a statement DataFrame to a feature matrix."""
         raise NotImplementedError('Need to implement the df_to_matrix '
                                    'method')
 
     def to_matrix(self,
-        stmt_data: Union[np.ndarray, Sequence[Statement], pd.DataFrame],
+        stmt_data: Union[np.ndarray, sparse.csr_matrix,
+                         Sequence[Statement], pd.DataFrame],
         extra_evidence: Optional[List[List[Evidence]]] = None,
-    ) -> np.ndarray:
+    ) -> Union[np.ndarray, sparse.csr_matrix]:
         """Get stmt feature matrix by calling appropriate method.
 
         If `stmt_data` is already a matrix (e.g., obtained after performing a
@@ -87,6 +96,12 @@ class SklearnScorer(BeliefScorer):
         `self.df_to_matrix` is called; if a list of Statements,
         `self.stmts_to_matrix` is called.
 
+        The result of the most recent DataFrame conversion is cached, so
+        consecutive calls on the same DataFrame object (e.g. predict_proba
+        followed by predict) convert it only once. Note that the cache is
+        keyed on object identity and does not detect in-place modification
+        of the DataFrame.
+
         Parameters
         ----------
         stmt_data :
@@ -102,8 +117,8 @@ class SklearnScorer(BeliefScorer):
         :
             Feature matrix for the statement data.
         """
-        # If we got a Numpy array, just use it!
-        if isinstance(stmt_data, np.ndarray):
+        # If we got a Numpy array or sparse matrix, just use it!
+        if isinstance(stmt_data, np.ndarray) or sparse.issparse(stmt_data):
             stmt_arr = stmt_data
         # Otherwise check if we have a dataframe or a list of statements
         # and call the appropriate *_to_matrix method
@@ -111,7 +126,14 @@ class SklearnScorer(BeliefScorer):
             if extra_evidence is not None:
                 raise NotImplementedError(
                    'extra_evidence cannot be used with a statement DataFrame.')
-            stmt_arr = self.df_to_matrix(stmt_data)
+            # Reuse the previous conversion if given the same DataFrame
+            # object again
+            if self._df_matrix_cache is not None and \
+                    self._df_matrix_cache[0]() is stmt_data:
+                stmt_arr = self._df_matrix_cache[1]
+            else:
+                stmt_arr = self.df_to_matrix(stmt_data)
+                self._df_matrix_cache = (weakref.ref(stmt_data), stmt_arr)
         # Check if stmt_data is a list/tuple (i.e., of Statements):
         elif isinstance(stmt_data, (list, tuple)):
             # Check that the first entry is a Statement
@@ -126,7 +148,8 @@ class SklearnScorer(BeliefScorer):
         return stmt_arr
 
     def fit(self,
-        stmt_data: Union[np.ndarray, Sequence[Statement], pd.DataFrame],
+        stmt_data: Union[np.ndarray, sparse.csr_matrix,
+                         Sequence[Statement], pd.DataFrame],
         y_arr: Sequence[float],
         extra_evidence: Optional[List[List[Evidence]]] = None,
         *args,
@@ -155,12 +178,15 @@ class SklearnScorer(BeliefScorer):
             raise ValueError("Number of stmts/rows must match length of y_arr.")
         # Get the data matrix based on the stmt list or stmt DataFrame
         stmt_arr = self.to_matrix(stmt_data, extra_evidence)
+        # Any cached probabilities were produced by the previous fit
+        self._proba_cache = None
         # Call the fit method of the internal sklearn model
         self.model.fit(stmt_arr, y_arr, *args, **kwargs)
 
     def predict_proba(
         self,
-        stmt_data: Union[np.ndarray, Sequence[Statement], pd.DataFrame],
+        stmt_data: Union[np.ndarray, sparse.csr_matrix,
+                         Sequence[Statement], pd.DataFrame],
         extra_evidence: Optional[List[List[Evidence]]] = None,
         *args,
         **kwargs,
@@ -182,11 +208,19 @@ class SklearnScorer(BeliefScorer):
         """
         # Call the prediction method of the internal sklearn model
         stmt_arr = self.to_matrix(stmt_data, extra_evidence)
-        return self.model.predict_proba(stmt_arr, *args, **kwargs)
+        proba = self.model.predict_proba(stmt_arr, *args, **kwargs)
+        # Remember the result so that predict/predict_log_proba on the
+        # same feature matrix can reuse it instead of running the model
+        # again. For DataFrame and ndarray inputs to_matrix returns the
+        # identical matrix object across calls, making the reuse check a
+        # simple identity comparison.
+        self._proba_cache = (weakref.ref(stmt_arr), proba)
+        return proba
 
     def predict(
         self,
-        stmt_data: Union[np.ndarray, Sequence[Statement], pd.DataFrame],
+        stmt_data: Union[np.ndarray, sparse.csr_matrix,
+                         Sequence[Statement], pd.DataFrame],
         extra_evidence: Optional[List[List[Evidence]]] = None,
         *args,
         **kwargs,
@@ -207,11 +241,18 @@ class SklearnScorer(BeliefScorer):
             aren't already included in the Statement's own evidence list).
         """
         stmt_arr = self.to_matrix(stmt_data, extra_evidence)
+        # Derive the predicted class from cached probabilities if we
+        # just computed them for this same matrix
+        if not args and not kwargs and self._proba_cache is not None \
+                and self._proba_cache[0]() is stmt_arr:
+            proba = self._proba_cache[1]
+            return self.model.classes_[np.argmax(proba, axis=1)]
         return self.model.predict(stmt_arr, *args, **kwargs)
 
     def predict_log_proba(
         self,
-        stmt_data: Union[np.ndarray, Sequence[Statement], pd.DataFrame],
+        stmt_data: Union[np.ndarray, sparse.csr_matrix,
+                         Sequence[Statement], pd.DataFrame],
         extra_evidence: Optional[List[List[Evidence]]] = None,
         *args,
         **kwargs,
@@ -232,6 +273,11 @@ class SklearnScorer(BeliefScorer):
             aren't already included in the Statement's own evidence list).
         """
         stmt_arr = self.to_matrix(stmt_data, extra_evidence)
+        # Derive the log probabilities from cached probabilities if we
+        # just computed them for this same matrix
+        if not args and not kwargs and self._proba_cache is not None \
+                and self._proba_cache[0]() is stmt_arr:
+            return np.log(self._proba_cache[1])
         return self.model.predict_log_proba(stmt_arr, *args, **kwargs)
 
 
@@ -358,24 +404,24 @@ class CountsScorer(SklearnScorer):
         :
             A list of (unique) source_apis found in the set of statements.
         """
-        stmt_sources = set([ev.source_api for s in stmts for ev in s.evidence])
-        if include_more_specific:
-            stmt_sources.update([ev.source_api
-                                 for stmt in stmts
-                                 for supp_stmt in stmt.supports
-                                 for ev in supp_stmt.evidence])
-        if include_less_specific:
-            stmt_sources.update([ev.source_api
-                                 for stmt in stmts
-                                 for supp_by_stmt in stmt.supported_by
-                                 for ev in supp_by_stmt.evidence])
+        stmt_sources = set()
+        for stmt in stmts:
+            stmt_sources.update(ev.source_api for ev in stmt.evidence)
+            if include_more_specific:
+                for supp_stmt in stmt.supports:
+                    stmt_sources.update(ev.source_api
+                                        for ev in supp_stmt.evidence)
+            if include_less_specific:
+                for supp_by_stmt in stmt.supported_by:
+                    stmt_sources.update(ev.source_api
+                                        for ev in supp_by_stmt.evidence)
         return list(stmt_sources)
 
     def stmts_to_matrix(
         self,
         stmts: Sequence[Statement],
         extra_evidence: Optional[List[List[Evidence]]] = None,
-    ) -> np.ndarray:
+    ) -> Union[np.ndarray, sparse.csr_matrix]:
         """Convert a list of Statements to a feature matrix.
 
         Features are encoded as follows:
@@ -408,7 +454,10 @@ class CountsScorer(SklearnScorer):
         Returns
         -------
         :
-            Feature matrix for the statement data.
+            Feature matrix for the statement data. When the one-hot
+            statement type expansion makes the matrix mostly zeros, it is
+            returned as a `scipy.sparse.csr_matrix` rather than a dense
+            array; sklearn models consume either directly.
         """
         # Check arguments for including more specific evidences
         if self.include_more_specific and extra_evidence is None:
@@ -421,16 +470,24 @@ class CountsScorer(SklearnScorer):
                            "evidences so extra_evidence will be ignored.")
         # Check our list of extra evidences
         check_extra_evidence(extra_evidence, len(stmts))
-        # Add categorical features and collect source_apis
+        # Add categorical features and check source_api coverage. Flagging
+        # unknown sources as soon as the first one is seen surfaces a
+        # misconfigured source_list immediately rather than after the
+        # whole statement list has been traversed
+        known_sources = set(self.source_list)
+        unknown_source_seen = False
         cat_features = []
-        stmt_sources = set()
         for ix, stmt in enumerate(stmts):
             # Collect all source_apis from stmt evidences
             dir_pmids = set()
             promoter_ct = 0
             evidence_lens = []
             for ev in stmt.evidence:
-                stmt_sources.add(ev.source_api)
+                if not unknown_source_seen and \
+                        ev.source_api not in known_sources:
+                    logger.info("source_list does not include all "
+                                "source_apis in the statement data.")
+                    unknown_source_seen = True
                 dir_pmids.add(ev.pmid)
                 if ev.text is not None:
                     evidence_lens.append(len(ev.text.split()))
@@ -440,15 +497,19 @@ class CountsScorer(SklearnScorer):
             indir_pmids = set()
             if self.include_more_specific and extra_evidence:
                 for ev in extra_evidence[ix]:
-                    stmt_sources.add(ev.source_api)
+                    if not unknown_source_seen and \
+                            ev.source_api not in known_sources:
+                        logger.info("source_list does not include all "
+                                    "source_apis in the statement data.")
+                        unknown_source_seen = True
                     indir_pmids.add(ev.pmid)
             # Collect non-source count features (e.g. type) from stmts
             feature_row: List[Any] = [] # Appease the Type Hint Gods
             # One-hot encoding of stmt type
             if self.use_stmt_type:
                 stmt_type_ix = self.stmt_type_map[type(stmt).__name__]
-                type_features = [1 if ix == stmt_type_ix else 0
-                                 for ix in range(len(self.stmt_type_map))]
+                type_features = [0] * len(self.stmt_type_map)
+                type_features[stmt_type_ix] = 1
                 feature_row.extend(type_features)
             if self.use_residue_position:
                 if (isinstance(stmt, Modification) and stmt.residue and
@@ -480,11 +541,6 @@ class CountsScorer(SklearnScorer):
             if feature_row:
                 cat_features.append(feature_row)
 
-        # Before proceeding, check whether all source_apis are in
-        # source_list
-        if stmt_sources.difference(set(self.source_list)):
-            logger.info("source_list does not include all source_apis "
-                             "in the statement data.")
         # Get source count features
         # If we have extra_evidence, we double the source count features
         if self.include_more_specific: 
@@ -492,33 +548,45 @@ class CountsScorer(SklearnScorer):
         else:
             num_cols = len(self.source_list)
         num_rows = len(stmts)
-        x_arr = np.zeros((num_rows, num_cols))
+        num_sources = len(self.source_list)
+        # Map each source to its column so the fill below iterates over
+        # the (few) sources present in each statement's evidence rather
+        # than scanning the full source list per statement
+        src_ix_map = {src: src_ix
+                      for src_ix, src in enumerate(self.source_list)}
+        x_arr = np.zeros((num_rows, num_cols), dtype=np.float32)
         for stmt_ix, stmt in enumerate(stmts):
             # Source from the stmt itself
-            direct_sources = [ev.source_api for ev in stmt.evidence]
-            dsrc_ctr = Counter(direct_sources)
-            for src_ix, src in enumerate(self.source_list):
-                x_arr[stmt_ix, src_ix] = dsrc_ctr.get(src, 0)
+            dsrc_ctr = Counter(ev.source_api for ev in stmt.evidence)
+            for src, count in dsrc_ctr.items():
+                src_ix = src_ix_map.get(src)
+                if src_ix is not None:
+                    x_arr[stmt_ix, src_ix] = count
             # Get indirect evidences
             if self.include_more_specific and extra_evidence:
-                indirect_sources = [ev.source_api
-                                    for ev in extra_evidence[stmt_ix]]
-                idsrc_ctr = Counter(indirect_sources)
-                for src_ix, src in enumerate(self.source_list):
-                    x_arr[stmt_ix, src_ix + len(self.source_list)] = \
-                                            idsrc_ctr.get(src, 0)
+                idsrc_ctr = Counter(ev.source_api
+                                    for ev in extra_evidence[stmt_ix])
+                for src, count in idsrc_ctr.items():
+                    src_ix = src_ix_map.get(src)
+                    if src_ix is not None:
+                        x_arr[stmt_ix, src_ix + num_sources] = count
         # If we have any categorical features, turn them into an array and
         # add them to matrix
         if cat_features:
-            cat_arr = np.array(cat_features)
+            cat_arr = np.array(cat_features, dtype=np.float32)
             x_arr = np.hstack((x_arr, cat_arr))
+        # With the one-hot statement type columns included the matrix is
+        # overwhelmingly zero; sklearn models consume CSR input natively,
+        # so return a sparse matrix rather than paying for the zeros
+        if self.use_stmt_type and len(self.stmt_type_map) > 8:
+            return sparse.csr_matrix(x_arr)
         return x_arr
 
 
     def df_to_matrix(
         self,
         df: pd.DataFrame,
-    ) -> np.ndarray:
+    ) -> Union[np.ndarray, sparse.csr_matrix]:
         """Convert a DataFrame of statement data to a feature matrix.
 
         Based on information available in a DataFrame of statement data, this
@@ -546,7 +614,10 @@ class CountsScorer(SklearnScorer):
         Returns
         -------
         :
-            Feature matrix for the statement data.
+            Feature matrix for the statement data. When the one-hot
+            statement type expansion makes the matrix mostly zeros, it is
+            returned as a `scipy.sparse.csr_matrix` rather than a dense
+            array; sklearn models consume either directly.
         """
         required_cols = {'stmt_type'}
         # Currently, statement DataFrames are not expected to contain
@@ -578,23 +649,18 @@ class CountsScorer(SklearnScorer):
         # Add categorical features and collect source_apis
         cat_features = []
         stmt_sources = set()
-        # For every statement entry in the dataframe...
-        for rowtup in df.itertuples():
-            # Collect statement sources
-            # ...if there's a source_counts col with dicts
-            if has_sc_col:
-                stmt_sources |= set(rowtup.source_counts.keys())
-            # Collect non-source count features (e.g. type) from stmts
-            feature_row = []
-            # One-hot encoding of stmt type
-            if self.use_stmt_type:
-                stmt_type_ix = self.stmt_type_map[rowtup.stmt_type]
-                type_features = [1 if ix == stmt_type_ix else 0
-                                 for ix in range(len(self.stmt_type_map))]
-                feature_row.extend(type_features)
-            # Only add a feature row if we're using some of the features.
-            if feature_row:
-                cat_features.append(feature_row)
+        # Collect statement sources if there's a source_counts col with dicts
+        if has_sc_col:
+            for counts in df['source_counts']:
+                stmt_sources.update(counts)
+        # Collect non-source count features (e.g. type) from stmts via
+        # one-hot encoding of stmt type
+        if self.use_stmt_type:
+            num_types = len(self.stmt_type_map)
+            for stmt_type in df['stmt_type']:
+                type_features = [0] * num_types
+                type_features[self.stmt_type_map[stmt_type]] = 1
+                cat_features.append(type_features)
 
         # Before proceeding, check whether all source_apis are in
         # source_list. If we don't have a source_counts dict, we don't look
@@ -606,24 +672,30 @@ class CountsScorer(SklearnScorer):
                            f"in the statement data: {str(source_diff)}")
 
         # Get source count features
-        num_cols = len(self.source_list)
-        num_rows = len(df)
-        x_arr = np.zeros((num_rows, num_cols))
-        for stmt_ix, rowtup in enumerate(df.itertuples()):
-            for src_ix, src in enumerate(self.source_list):
-                # Get counts from the source_count dictionary
-                if has_sc_col:
-                    x_arr[stmt_ix, src_ix] = rowtup.source_counts.get(src, 0)
-                # ...or get counts from named source column
-                else:
-                    x_arr[stmt_ix, src_ix] = rowtup._asdict()[src]
+        if has_sc_col:
+            # Get counts from the source_count dictionaries
+            x_arr = np.asarray([[counts.get(src, 0)
+                                 for src in self.source_list]
+                                for counts in df['source_counts']],
+                               dtype=np.float32)
+        else:
+            # ...or get counts from named source columns
+            x_arr = np.stack([df[src].to_numpy(copy=False)
+                              for src in self.source_list],
+                             axis=1).astype(np.float32, copy=False)
 
         # If we have any categorical features, turn them into an array and
         # add them to matrix
         if cat_features:
-            cat_arr = np.array(cat_features)
+            cat_arr = np.array(cat_features, dtype=np.float32)
             x_arr = np.hstack((x_arr, cat_arr))
-        return x_arr
+        # As in stmts_to_matrix, return CSR when the one-hot statement
+        # type expansion makes the matrix mostly zeros
+        if self.use_stmt_type and len(self.stmt_type_map) > 8:
+            return sparse.csr_matrix(x_arr)
+        # Column-contiguous layout suits sklearn solvers, which work on
+        # the features column by column
+        return np.asfortranarray(x_arr)
 
 
 class HybridScorer(BeliefScorer):
@@ -0,0 +1,221 @@
+"""This module provides programmatic access to the JSON schema for INDRA
+Statements (indra/resources/statements_schema.json) along with a validator
+instance that is constructed only once, when this module is first imported.
+Creating a jsonschema validator involves checking the schema against the
+meta-schema and setting up resolution for its internal references, which
+is wasteful to repeat for every validation. Reusing the validator exposed
+here amortizes that cost across all validation calls.
+"""
+
+__all__ = ['JSON_SCHEMA', 'VALIDATOR', 'get_validator',
+           'validate_statements_json', 'validate_statement_json',
+           'schema_json_str']
+
+import copy
+import json
+import os
+from functools import lru_cache
+
+from jsonschema import Draft6Validator
+
+
+@lru_cache(maxsize=1)
+def _load_schema():
+    this_dir = os.path.dirname(os.path.abspath(__file__))
+    schema_file = os.path.join(this_dir, os.pardir, 'resources',
+                               'statements_schema.json')
+    with open(schema_file, 'r') as fh:
+        return json.load(fh)
+
+
+@lru_cache(maxsize=1)
+def get_validator():
+    """Return the single shared validator for the INDRA Statement schema.
+
+    The validator is constructed (including the meta-schema check) only
+    the first time this function is called; all later calls return the
+    same cached instance so that every consumer in the process shares
+    one compiled validator.
+
+    Returns
+    -------
+    jsonschema.Draft6Validator
+        The shared validator instance for the INDRA Statement schema.
+    """
+    schema = _load_schema()
+    Draft6Validator.check_schema(schema)
+    return Draft6Validator(schema)
+
+
+def _inline_refs(node, defs, seen=frozenset()):
+    """Return a copy of the given schema node with $refs inlined.
+
+    References to definitions that are already being expanded (e.g. the
+    Agent->BoundCondition->Agent cycle) are left as $refs so that the
+    result remains finite; all other references are replaced by the
+    expanded definition itself.
+    """
+    if isinstance(node, dict):
+        ref = node.get('$ref')
+        if ref is not None and ref.startswith('#/definitions/'):
+            name = ref.rsplit('/', 1)[1]
+            if name in seen:
+                return dict(node)
+            expanded = _inline_refs(defs[name], defs, seen | {name})
+            # Keep any annotation keys given alongside the $ref, e.g.
+            # a local description overriding the definition's one.
+            expanded.update({k: v for k, v in node.items() if k != '$ref'})
+            return expanded
+        return {k: _inline_refs(v, defs, seen) for k, v in node.items()}
+    elif isinstance(node, list):
+        return [_inline_refs(v, defs, seen) for v in node]
+    return node
+
+
+@lru_cache(maxsize=1)
+def _flattened_schema():
+    """Return a copy of the schema with definition references pre-inlined.
+
+    Inlining removes the per-call indirection of resolving $refs during
+    validation; only the definitions that participate in reference
+    cycles still need to be resolved at validation time.
+    """
+    schema = copy.deepcopy(_load_schema())
+    defs = schema['definitions']
+    flat = _inline_refs({k: v for k, v in schema.items()
+                         if k != 'definitions'}, defs)
+    # Cyclic refs were left intact, so the definitions they point to
+    # must stay resolvable in the flattened schema.
+    flat['definitions'] = _inline_refs(defs, defs)
+    return flat
+
+
+JSON_SCHEMA = _load_schema()
+VALIDATOR = get_validator()
+
+# If available, fastjsonschema is used as a faster alternative to
+# jsonschema: it compiles the schema into a specialized Python function
+# once, which avoids walking the schema as a generic object tree on
+# every validation. The flattened schema is compiled so that the
+# generated code validates each definition inline instead of resolving
+# references at validation time.
+try:
+    import fastjsonschema
+    _fast_validate = fastjsonschema.compile(_flattened_schema())
+except ImportError:
+    _fast_validate = None
+
+
+def _type_values(node, defs, seen=frozenset()):
+    """Yield the values of the type discriminator in a statement schema."""
+    if not isinstance(node, dict):
+        return
+    ref = node.get('$ref')
+    if ref is not None and ref.startswith('#/definitions/'):
+        name = ref.rsplit('/', 1)[1]
+        if name not in seen:
+            yield from _type_values(defs[name], defs, seen | {name})
+        return
+    type_prop = node.get('properties', {}).get('type', {})
+    yield from type_prop.get('enum', [])
+    for sub in node.get('allOf', []):
+        yield from _type_values(sub, defs, seen)
+
+
+@lru_cache(maxsize=1)
+def _type_dispatch():
+    """Return a dict mapping statement type names to subschema validators.
+
+    The root schema allows each statement to match any of the statement
+    definitions, which makes generic validators try the alternatives one
+    by one. Since the type field of a statement uniquely determines its
+    definition, a direct lookup avoids that scan.
+    """
+    schema = _load_schema()
+    defs = schema['definitions']
+    dispatch = {}
+    for ref in schema['items']['anyOf']:
+        name = ref['$ref'].rsplit('/', 1)[1]
+        validator = Draft6Validator({'definitions': defs,
+                                     '$ref': '#/definitions/%s' % name})
+        for type_value in _type_values(ref, defs):
+            dispatch[type_value] = validator
+    return dispatch
+
+
+def validate_statement_json(stmt_json):
+    """Validate a single Statement JSON against the INDRA JSON schema.
+
+    The statement's type field is used to select the matching statement
+    subschema directly, rather than scanning all statement definitions
+    the way validating against the full schema would.
+
+    Parameters
+    ----------
+    stmt_json : dict
+        A JSON dict representation of an INDRA Statement.
+
+    Raises
+    ------
+    jsonschema.exceptions.ValidationError
+        If the given Statement JSON is invalid with respect to the
+        schema.
+    """
+    validator = None
+    if isinstance(stmt_json, dict):
+        validator = _type_dispatch().get(stmt_json.get('type'))
+    if validator is not None:
+        validator.validate(stmt_json)
+    else:
+        # Unknown or missing type: fall back to the full schema so the
+        # usual validation error is raised.
+        VALIDATOR.validate([stmt_json])
+
+
+@lru_cache(maxsize=1)
+def schema_json_str():
+    """Return the INDRA Statement JSON schema serialized as a string.
+
+    The string is generated lazily on first call and then cached, so
+    that consumers which only need the schema dict never pay the
+    serialization cost. The output is compact JSON without any
+    inter-element whitespace, keeping the payload small when the schema
+    is embedded in a prompt or a request.
+
+    Returns
+    -------
+    str
+        The JSON-serialized INDRA Statement schema.
+    """
+    return json.dumps(JSON_SCHEMA, separators=(',', ':'))
+
+
+def validate_statements_json(stmts_json):
+    """Validate a list of Statement JSONs against the INDRA JSON schema.
+
+    If the optional fastjsonschema package is installed, a validator
+    function precompiled from the schema is used, otherwise validation
+    falls back to the shared jsonschema validator.
+
+    Parameters
+    ----------
+    stmts_json : list[dict]
+        A list of JSON dict representations of INDRA Statements, as
+        produced by the `to_json` methods of subclasses of Statement.
+
+    Raises
+    ------
+    jsonschema.exceptions.ValidationError
+        If the given list of Statement JSONs is invalid with respect
+        to the schema and jsonschema was used for validation.
+    fastjsonschema.JsonSchemaException
+        If the given list of Statement JSONs is invalid with respect
+        to the schema and fastjsonschema was used for validation.
+    """
+    if _fast_validate is not None:
+        _fast_validate(stmts_json)
+    elif isinstance(stmts_json, list):
+        for stmt_json in stmts_json:
+            validate_statement_json(stmt_json)
+    else:
+        VALIDATOR.validate(stmts_json)
@@ -1,293 +1,365 @@
 import pickle
-from copy import deepcopy
+from copy import copy, deepcopy
+from functools import lru_cache
+from operator import attrgetter
+from types import SimpleNamespace
+
+import pytest
+
 from indra.statements import *
 from indra.tools import assemble_corpus as ac
 
 
-a = Agent('a', db_refs={'HGNC': '1234', 'TEXT': 'a'})
-b = Agent('b', db_refs={'UP': 'P15056', 'TEXT': 'b'})
-c = Agent('c', db_refs={'FPLX': 'XXX', 'TEXT': 'c'})
-d = Agent('d', db_refs={'TEXT': 'd'})
-e = Agent('e', db_refs={'CHEBI': 'CHEBI:1234', 'TEXT': 'e'})
-f = Agent('b', db_refs={'UP': 'P28028', 'TEXT': 'b'})
-g = Agent('g', db_refs={'FPLX': 'ERK'})
-h = Agent('g', mods=['x', 'y'], mutations=['x', 'y'], activity='x',
-               location='nucleus', bound_conditions=['x', 'y', 'z'])
-i = Agent('a', db_refs={'HGNC': '1234', 'TEXT': 'a'},
-          bound_conditions=[BoundCondition(d)])
-j = Agent('a', db_refs={'HGNC': '1234', 'TEXT': 'a'},
-          bound_conditions=[BoundCondition(b)])
-k = Agent('a', db_refs={'HGNC': '1234', 'TEXT': 'a'},
-          bound_conditions=[BoundCondition(f)])
-l = Agent('a', db_refs={'HGNC': '1234', 'TEXT': 'a'},
-          bound_conditions=[BoundCondition(a)])
-
-mapk1 = Agent('MAPK1', db_refs={'HGNC':'6871', 'UP':'P28482'})
-erk = Agent('ERK', db_refs={'FPLX': 'ERK'})
-st1 = Phosphorylation(a, b, evidence=[Evidence(text='a->b', source_api='assertion')])
-st2 = Phosphorylation(a, d, evidence=[Evidence(text='a->d', source_api='assertion')])
-st3 = Phosphorylation(c, d, evidence=[Evidence(text='c->d', source_api='assertion')])
-st4 = Phosphorylation(b, e, evidence=[Evidence(text='b->e', source_api='assertion')])
-st5 = Phosphorylation(None, b, evidence=[Evidence(text='->b', source_api='assertion')])
-st6 = Phosphorylation(None, d, evidence=[Evidence(text='->d', source_api='assertion')])
-st7 = Phosphorylation(None, e, evidence=[Evidence(text='->e', source_api='assertion')])
-st8 = Phosphorylation(b, f, evidence=[Evidence(text='b->f', source_api='assertion')])
-st9 = Phosphorylation(None, f, evidence=[Evidence(text='->f', source_api='assertion')])
-st10 = Phosphorylation(None, g, evidence=[Evidence(text='->g', source_api='assertion')])
-st11 = Phosphorylation(None, h, evidence=[Evidence(text='->h', source_api='assertion')])
-st12 = Phosphorylation(a, b, evidence=[Evidence(epistemics={'direct': True})])
-st13 = Phosphorylation(a, b, evidence=[Evidence(epistemics={'direct': False})])
-st14 = Activation(a, b, 'activity')
-st15 = Activation(a, b, 'kinase')
-st14.supports = [st15]
-st15.supported_by = [st14]
-st16 = Phosphorylation(a, mapk1)
-st17 = Phosphorylation(a, erk)
-st18 = Phosphorylation(a, i)
-st19 = Phosphorylation(a, j)
-st20 = Phosphorylation(a, k)
-st21 = Phosphorylation(a, l)
-st1.belief = 0.9
-st2.belief = 0.8
-st3.belief = 0.7
-
-
-def test_load_stmts():
-    with open('_test.pkl', 'wb') as fh:
-        pickle.dump([st1], fh)
-    st_loaded = ac.load_statements('_test.pkl')
+# db_refs literals shared by several fixture agents; Agent stores the
+# dict it is given, so each use passes its own copy
+_DBREFS_A = {'HGNC': '1234', 'TEXT': 'a'}
+_DBREFS_ERK = {'FPLX': 'ERK'}
+
+# Epistemics literals reused across Evidence constructions; the filters
+# under test only ever read these, so the dicts can be shared
+_EP_DIRECT_T = {'direct': True}
+_EP_DIRECT_F = {'direct': False}
+_EP_HYP_T = {'hypothesis': True}
+_EP_HYP_F = {'hypothesis': False}
+_EP_NEG_T = {'negated': True}
+_EP_NEG_F = {'negated': False}
+
+
+@lru_cache(maxsize=None)
+def _assertion_ev(text):
+    """Return a shared assertion Evidence for the given text.
+
+    The filter tests only inspect these Evidence objects, so one
+    interned instance per text can be reused across statements.
+    """
+    return Evidence(text=text, source_api='assertion')
+
+
+@pytest.fixture(scope='module')
+def stmts():
+    """Construct the shared test Agents and Statements once per module.
+
+    Building these objects involves Evidence construction, UUID
+    generation and hash computation, so they are created lazily here
+    rather than at import time, and shared across the tests of this
+    module. Tests that mutate a statement make their own deepcopy.
+    """
+    ns = SimpleNamespace()
+    ns.a = Agent('a', db_refs=dict(_DBREFS_A))
+    ns.b = Agent('b', db_refs={'UP': 'P15056', 'TEXT': 'b'})
+    ns.c = Agent('c', db_refs={'FPLX': 'XXX', 'TEXT': 'c'})
+    ns.d = Agent('d', db_refs={'TEXT': 'd'})
+    ns.e = Agent('e', db_refs={'CHEBI': 'CHEBI:1234', 'TEXT': 'e'})
+    ns.f = Agent('b', db_refs={'UP': 'P28028', 'TEXT': 'b'})
+    ns.g = Agent('g', db_refs=dict(_DBREFS_ERK))
+    ns.h = Agent('g', mods=['x', 'y'], mutations=['x', 'y'], activity='x',
+                 location='nucleus', bound_conditions=['x', 'y', 'z'])
+    ns.i = Agent('a', db_refs=dict(_DBREFS_A),
+                 bound_conditions=[BoundCondition(ns.d)])
+    ns.j = Agent('a', db_refs=dict(_DBREFS_A),
+                 bound_conditions=[BoundCondition(ns.b)])
+    ns.k = Agent('a', db_refs=dict(_DBREFS_A),
+                 bound_conditions=[BoundCondition(ns.f)])
+    ns.l = Agent('a', db_refs=dict(_DBREFS_A),
+                 bound_conditions=[BoundCondition(ns.a)])
+
+    ns.mapk1 = Agent('MAPK1', db_refs={'HGNC': '6871', 'UP': 'P28482'})
+    ns.erk = Agent('ERK', db_refs=dict(_DBREFS_ERK))
+    ns.st1 = Phosphorylation(ns.a, ns.b, evidence=[
+        _assertion_ev('a->b')])
+    ns.st2 = Phosphorylation(ns.a, ns.d, evidence=[
+        _assertion_ev('a->d')])
+    ns.st3 = Phosphorylation(ns.c, ns.d, evidence=[
+        _assertion_ev('c->d')])
+    ns.st4 = Phosphorylation(ns.b, ns.e, evidence=[
+        _assertion_ev('b->e')])
+    ns.st5 = Phosphorylation(None, ns.b, evidence=[
+        _assertion_ev('->b')])
+    ns.st6 = Phosphorylation(None, ns.d, evidence=[
+        _assertion_ev('->d')])
+    ns.st7 = Phosphorylation(None, ns.e, evidence=[
+        _assertion_ev('->e')])
+    ns.st8 = Phosphorylation(ns.b, ns.f, evidence=[
+        _assertion_ev('b->f')])
+    ns.st9 = Phosphorylation(None, ns.f, evidence=[
+        _assertion_ev('->f')])
+    ns.st10 = Phosphorylation(None, ns.g, evidence=[
+        _assertion_ev('->g')])
+    ns.st11 = Phosphorylation(None, ns.h, evidence=[
+        _assertion_ev('->h')])
+    ns.st12 = Phosphorylation(ns.a, ns.b, evidence=[
+        Evidence(epistemics=_EP_DIRECT_T)])
+    ns.st13 = Phosphorylation(ns.a, ns.b, evidence=[
+        Evidence(epistemics=_EP_DIRECT_F)])
+    ns.st14 = Activation(ns.a, ns.b, 'activity')
+    ns.st15 = Activation(ns.a, ns.b, 'kinase')
+    ns.st14.supports = [ns.st15]
+    ns.st15.supported_by = [ns.st14]
+    ns.st16 = Phosphorylation(ns.a, ns.mapk1)
+    ns.st17 = Phosphorylation(ns.a, ns.erk)
+    ns.st18 = Phosphorylation(ns.a, ns.i)
+    ns.st19 = Phosphorylation(ns.a, ns.j)
+    ns.st20 = Phosphorylation(ns.a, ns.k)
+    ns.st21 = Phosphorylation(ns.a, ns.l)
+    ns.st1.belief = 0.9
+    ns.st2.belief = 0.8
+    ns.st3.belief = 0.7
+    return ns
+
+
+def _clone_for_bound_mutation(st):
+    """Make a cheap copy of a statement whose sub agent's bound conditions
+    will be modified by a filter.
+
+    The remove_bound path of the filters reassigns the agent's
+    bound_conditions attribute rather than mutating the list, so copying
+    the statement and the agent is enough to protect the shared fixture
+    objects; a full deepcopy of all nested evidence is unnecessary.
+    """
+    st_new = copy(st)
+    st_new.sub = copy(st.sub)
+    return st_new
+
+
+def test_load_stmts(stmts, tmp_path):
+    path = tmp_path / 'test.pkl'
+    with open(path, 'wb') as fh:
+        pickle.dump([stmts.st1], fh, protocol=pickle.HIGHEST_PROTOCOL)
+    st_loaded = ac.load_statements(path)
     assert len(st_loaded) == 1
-    assert st_loaded[0].equals(st1)
-
-
-def test_dump_stmts():
-    ac.dump_statements([st1], '_test.pkl')
-    st_loaded = ac.load_statements('_test.pkl')
+    assert st_loaded[0].equals(stmts.st1)
+
+
+@pytest.mark.parametrize('dump, load, fname',
+                         [(ac.dump_statements, ac.load_statements,
+                           'test.pkl'),
+                          pytest.param(ac.dump_statements_fast,
+                                       ac.load_statements_fast,
+                                       'test.msgpack',
+                                       marks=pytest.mark.skipif(
+                                           ac.msgpack is None,
+                                           reason='msgpack not available'))])
+def test_dump_stmts(stmts, tmp_path, dump, load, fname):
+    path = tmp_path / fname
+    dump([stmts.st1], path)
+    st_loaded = load(path)
     assert len(st_loaded) == 1
-    assert st_loaded[0].equals(st1)
+    assert st_loaded[0].equals(stmts.st1)
 
 
-def test_filter_grounded_only():
+def test_filter_grounded_only(stmts):
     # st18 has and i, which has an ungrounded bound condition
-    st_out = ac.filter_grounded_only([st1, st4])
+    st_out = ac.filter_grounded_only([stmts.st1, stmts.st4])
     assert len(st_out) == 2
-    st_out = ac.filter_grounded_only([st3])
+    st_out = ac.filter_grounded_only([stmts.st3])
     assert len(st_out) == 0
 
     # Do we filter out a statement with an ungrounded bound condition?
-    st_out = ac.filter_grounded_only([st18])
+    st_out = ac.filter_grounded_only([stmts.st18])
     assert len(st_out) == 0
 
     # When we request to remove ungrounded bound conditions, do we?
-    st18_copy = deepcopy(st18)
+    st18_copy = _clone_for_bound_mutation(stmts.st18)
     assert len(st18_copy.sub.bound_conditions) == 1
     st_out = ac.filter_grounded_only([st18_copy], remove_bound=True)
     assert len(st_out[0].sub.bound_conditions) == 0
 
     # When we request to remove ungrounded bound conditions, do we leave
     # grounded bound conditions in place?
-    st19_copy = deepcopy(st19)
+    st19_copy = _clone_for_bound_mutation(stmts.st19)
     assert len(st19_copy.sub.bound_conditions) == 1
     st_out = ac.filter_grounded_only([st19_copy], remove_bound=True)
     assert len(st_out[0].sub.bound_conditions) == 1
 
     # Do we filter out a statement with an grounded bound condition?
-    st_out = ac.filter_grounded_only([st19])
+    st_out = ac.filter_grounded_only([stmts.st19])
     assert len(st_out) == 1
 
 
 def test_filter_grounded_only_score():
     c1 = Event(Concept('x', db_refs={'a': [('x', 0.5), ('y', 0.8)]}))
     c2 = Event(Concept('x', db_refs={'a': [('x', 0.7), ('y', 0.9)]}))
-    st1 = Influence(c1, c2)
-    assert len(ac.filter_grounded_only([st1])) == 1
-    assert len(ac.filter_grounded_only([st1], score_threshold=0.4)) == 1
-    assert len(ac.filter_grounded_only([st1], score_threshold=0.6)) == 1
-    assert len(ac.filter_grounded_only([st1], score_threshold=0.85)) == 0
-    assert len(ac.filter_grounded_only([st1], score_threshold=0.95)) == 0
+    stmt_scored = Influence(c1, c2)
+    assert len(ac.filter_grounded_only([stmt_scored])) == 1
+    assert len(ac.filter_grounded_only([stmt_scored], score_threshold=0.4)) == 1
+    assert len(ac.filter_grounded_only([stmt_scored], score_threshold=0.6)) == 1
+    assert len(ac.filter_grounded_only([stmt_scored], score_threshold=0.85)) == 0
+    assert len(ac.filter_grounded_only([stmt_scored], score_threshold=0.95)) == 0
     c3 = Event(Concept('x', db_refs={'a': []}))
-    st2 = Influence(c1, c3)
-    assert len(ac.filter_grounded_only([st2])) == 0
+    stmt_empty = Influence(c1, c3)
+    assert len(ac.filter_grounded_only([stmt_empty])) == 0
 
 
-def test_filter_uuid_list():
-    st_out = ac.filter_uuid_list([st1, st4], [st1.uuid])
+def test_filter_uuid_list(stmts):
+    st_out = ac.filter_uuid_list([stmts.st1, stmts.st4], [stmts.st1.uuid])
     assert len(st_out) == 1
 
 
-def test_filter_genes_only():
-    st_out = ac.filter_genes_only([st1, st5])
+def test_filter_genes_only(stmts):
+    st_out = ac.filter_genes_only([stmts.st1, stmts.st5])
     assert len(st_out) == 2
-    st_out = ac.filter_genes_only([st6, st7])
+    st_out = ac.filter_genes_only([stmts.st6, stmts.st7])
     assert len(st_out) == 0
-    st_out = ac.filter_genes_only([st4])
+    st_out = ac.filter_genes_only([stmts.st4])
     assert len(st_out) == 0
-    st_out = ac.filter_genes_only([st3], specific_only=True)
+    st_out = ac.filter_genes_only([stmts.st3], specific_only=True)
     assert len(st_out) == 0
 
     # Can we remove statements with non-gene bound conditions?
-    st_out = ac.filter_genes_only([st18])  # remove_bound defaults to False
+    st_out = ac.filter_genes_only([stmts.st18])  # remove_bound defaults to False
     assert len(st_out) == 0
-    st_out = ac.filter_genes_only([st18], remove_bound=False)
+    st_out = ac.filter_genes_only([stmts.st18], remove_bound=False)
     assert len(st_out) == 0
 
     # Can we remove non-gene bound conditions?
-    st18_copy = deepcopy(st18)
+    st18_copy = _clone_for_bound_mutation(stmts.st18)
     assert len(st18_copy.sub.bound_conditions) == 1
     st_out = ac.filter_genes_only([st18_copy], remove_bound=True)
     assert len(st_out[0].sub.bound_conditions) == 0
 
 
-def test_filter_human_only():
-    st_out = ac.filter_human_only([st1, st5])
+def test_filter_human_only(stmts):
+    st_out = ac.filter_human_only([stmts.st1, stmts.st5])
     assert len(st_out) == 2
-    st_out = ac.filter_human_only([st8, st9])
+    st_out = ac.filter_human_only([stmts.st8, stmts.st9])
     assert len(st_out) == 0
 
     # Can we filter out statements with bound conditions grounded to non-human
     # genes?
-    st_out = ac.filter_human_only([st20], remove_bound=False)
+    st_out = ac.filter_human_only([stmts.st20], remove_bound=False)
     assert len(st_out) == 0
 
     # When we do such filtering, do we keep statements bounded to human genes?
-    st_out = ac.filter_human_only([st21], remove_bound=False)
+    st_out = ac.filter_human_only([stmts.st21], remove_bound=False)
     assert len(st_out) == 1
 
     # Can we remove bound conditions grounded to non-human genes?
-    st_out = ac.filter_human_only([st20], remove_bound=True)
+    st_out = ac.filter_human_only([stmts.st20], remove_bound=True)
     assert len(st_out) == 1
     assert len(st_out[0].sub.bound_conditions) == 0
 
     # When we do so, do we keep bound conditions not grounded to non-human
     # genes?
-    st_out = ac.filter_human_only([st21], remove_bound=True)
+    st_out = ac.filter_human_only([stmts.st21], remove_bound=True)
     assert len(st_out) == 1
     assert len(st_out[0].sub.bound_conditions) == 1
 
 
-def test_filter_gene_list_one():
-    st_out = ac.filter_gene_list([st1, st2], ['a'], 'one')
-    assert len(st_out) == 2
-    st_out = ac.filter_gene_list([st1, st2], ['a'], 'all')
-    assert len(st_out) == 0
-    st_out = ac.filter_gene_list([st1, st2], ['a', 'b'], 'all')
-    assert len(st_out) == 1
-    st_out = ac.filter_gene_list([st1, st2], ['a', 'b'], 'invalid')
-    assert len(st_out) == 2
-
+@pytest.mark.parametrize('gene_list, policy, invert, expected',
+                         [(['a'], 'one', False, 2),
+                          (['a'], 'all', False, 0),
+                          (['a', 'b'], 'all', False, 1),
+                          (['a', 'b'], 'invalid', False, 2),
+                          (['a'], 'one', True, 0),
+                          (['d'], 'one', True, 1),
+                          (['a', 'd'], 'all', True, 1),
+                          (['a', 'b', 'd'], 'all', True, 0)])
+def test_filter_gene_list(stmts, gene_list, policy, invert, expected):
+    st_out = ac.filter_gene_list([stmts.st1, stmts.st2], gene_list, policy,
+                                 invert=invert)
+    assert len(st_out) == expected
+    if invert and expected == 1:
+        assert st_out[0].sub.name == 'b'
+
+
+def test_filter_gene_list_bound_conditions(stmts):
     # Can we exclude a statement with a bound condition agent not on the filter
     # list?
-    st_out = ac.filter_gene_list([st18], ['a', 'b', 'd'], 'all')
+    st_out = ac.filter_gene_list([stmts.st18], ['a', 'b', 'd'], 'all')
     # All genes in the list
     assert len(st_out) == 1
-    st_out = ac.filter_gene_list([st18], ['a', 'b'], 'all')
+    st_out = ac.filter_gene_list([stmts.st18], ['a', 'b'], 'all')
     # Bound condition for sub not in list
     assert len(st_out) == 0
-    st_out = ac.filter_gene_list([st18], ['a', 'b'], 'one')
+    st_out = ac.filter_gene_list([stmts.st18], ['a', 'b'], 'one')
     # Bound condition for sub not in list but we only need to match one
     assert len(st_out) == 1
-    st_out = ac.filter_gene_list([st18], ['d'], 'one')
+    st_out = ac.filter_gene_list([stmts.st18], ['d'], 'one')
     # Only the bound condition is in filter list
     assert len(st_out) == 1
 
     # Can we remove bound conditions that are not in the filter list?
-    st_out = ac.filter_gene_list([st18], ['a', 'b', 'd'], 'all',
+    st_out = ac.filter_gene_list([stmts.st18], ['a', 'b', 'd'], 'all',
                                  remove_bound=True)
     assert len(st_out[0].sub.bound_conditions) == 1
-    st_out = ac.filter_gene_list([st18], ['a', 'b'], 'all',
+    st_out = ac.filter_gene_list([stmts.st18], ['a', 'b'], 'all',
                                  remove_bound=True)
     assert len(st_out[0].sub.bound_conditions) == 0
 
 
-def test_filter_gene_list_invert():
-    st_out = ac.filter_gene_list([st1, st2], ['a'], 'one', invert=True)
-    assert len(st_out) == 0
-    st_out = ac.filter_gene_list([st1, st2], ['d'], 'one', invert=True)
-    assert len(st_out) == 1
-    assert st_out[0].sub.name == 'b'
-    st_out = ac.filter_gene_list([st1, st2], ['a', 'd'], 'all', invert=True)
-    assert len(st_out) == 1
-    assert st_out[0].sub.name == 'b'
-    st_out = ac.filter_gene_list([st1, st2], ['a', 'b', 'd'], 'all',
-                                 invert=True)
-    assert len(st_out) == 0
-
-
-def test_filter_gene_list_families():
-    stmts_out = ac.filter_gene_list([st16, st17], ['MAPK1'], 'one',
+def test_filter_gene_list_families(stmts):
+    stmts_out = ac.filter_gene_list([stmts.st16, stmts.st17], ['MAPK1'], 'one',
                                     allow_families=False)
     assert len(stmts_out) == 1
-    assert stmts_out[0] == st16
-    stmts_out = ac.filter_gene_list([st16, st17], ['MAPK1'], 'one',
+    assert stmts_out[0] == stmts.st16
+    stmts_out = ac.filter_gene_list([stmts.st16, stmts.st17], ['MAPK1'], 'one',
                                     allow_families=True)
     assert len(stmts_out) == 2
-    assert st16 in stmts_out
-    assert st17 in stmts_out
+    assert stmts.st16 in stmts_out
+    assert stmts.st17 in stmts_out
 
 
-def test_run_preassembly():
-    st_out = ac.run_preassembly([st1, st3, st5, st6])
+def test_run_preassembly(stmts):
+    st_out = ac.run_preassembly([stmts.st1, stmts.st3, stmts.st5, stmts.st6])
     assert len(st_out) == 2
 
 
-def test_run_preassembly_all_stmts():
-    st_out = ac.run_preassembly([st1, st3, st5, st6], return_toplevel=False)
+def test_run_preassembly_all_stmts(stmts):
+    st_out = ac.run_preassembly([stmts.st1, stmts.st3, stmts.st5, stmts.st6], return_toplevel=False)
     assert len(st_out) == 4
 
 
-def test_expand_families():
-    st_out = ac.expand_families([st10])
+def test_expand_families(stmts):
+    st_out = ac.expand_families([stmts.st10])
     assert len(st_out) == 2
 
 
-def test_strip_agent_context():
-    st_out = ac.strip_agent_context([st11])
+def test_strip_agent_context(stmts):
+    st_out = ac.strip_agent_context([stmts.st11])
     assert len(st_out) == 1
-    assert not st_out[0].sub.mods
-    assert not st_out[0].sub.mutations
-    assert not st_out[0].sub.bound_conditions
-    assert not st_out[0].sub.activity
-    assert not st_out[0].sub.location
+    context = attrgetter('sub.mods', 'sub.mutations', 'sub.bound_conditions',
+                         'sub.activity', 'sub.location')
+    assert not any(context(st_out[0]))
 
 
-def test_filter_direct():
-    st_out = ac.filter_direct([st12])
+def test_filter_direct(stmts):
+    st_out = ac.filter_direct([stmts.st12])
     assert len(st_out) == 1
-    st_out = ac.filter_direct([st13])
+    st_out = ac.filter_direct([stmts.st13])
     assert len(st_out) == 0
 
 
-def test_filter_belief():
-    st_out = ac.filter_belief([st1, st2, st3], 0.75)
+def test_filter_belief(stmts):
+    st_out = ac.filter_belief([stmts.st1, stmts.st2, stmts.st3], 0.75)
     assert len(st_out) == 2
 
 
-def test_reduce_activities():
-    st_out = ac.reduce_activities([st14, st15])
+def test_reduce_activities(stmts):
+    st_out = ac.reduce_activities([stmts.st14, stmts.st15])
     assert st_out[0].obj_activity == 'kinase'
     assert st_out[1].obj_activity == 'kinase'
 
 
-def test_filter_source():
+@pytest.fixture(scope='module')
+def source_stmts():
     ev1 = Evidence(source_api='bel')
     ev2 = Evidence(source_api='biopax')
     ev3 = Evidence(source_api='reach')
-    st1 = Activation(Agent('a'), Agent('b'), evidence=[ev3])
-    st2  = Activation(Agent('a'), Agent('b'), evidence=[ev1, ev2])
-    st3 = Activation(Agent('a'), Agent('b'), evidence=[ev1, ev3])
-    st_out = ac.filter_evidence_source([st1, st2], ['reach'], 'one')
-    assert len(st_out) == 1
-    st_out = ac.filter_evidence_source([st1, st2, st3], ['reach'], 'all')
-    assert (len(st_out) == 2)
-    st_out = ac.filter_evidence_source([st1, st2, st3], ['bel', 'biopax'],
-                                       'one')
-    assert (len(st_out) == 2)
-    st_out = ac.filter_evidence_source([st1, st2, st3], ['bel', 'biopax'],
-                                       'all')
-    assert (len(st_out) == 1)
-    st_out = ac.filter_evidence_source([st1, st2, st3], ['bel', 'biopax'],
-                                       'none')
-    assert (len(st_out) == 1)
+    return [Activation(Agent('a'), Agent('b'), evidence=[ev3]),
+            Activation(Agent('a'), Agent('b'), evidence=[ev1, ev2]),
+            Activation(Agent('a'), Agent('b'), evidence=[ev1, ev3])]
+
+
+@pytest.mark.parametrize('n_stmts, source_apis, policy, expected',
+                         [(2, ['reach'], 'one', 1),
+                          (3, ['reach'], 'all', 2),
+                          (3, ['bel', 'biopax'], 'one', 2),
+                          (3, ['bel', 'biopax'], 'all', 1),
+                          (3, ['bel', 'biopax'], 'none', 1)])
+def test_filter_source(source_stmts, n_stmts, source_apis, policy, expected):
+    st_out = ac.filter_evidence_source(source_stmts[:n_stmts], source_apis,
+                                       policy)
+    assert len(st_out) == expected
 
 
 def test_map_grounding():
@@ -359,22 +431,22 @@ def test_map_sequence_blank_entries():
     assert len(mapped) == 0
 
 
-def test_filter_by_type():
-    st_out = ac.filter_by_type([st1, st14], Phosphorylation)
+def test_filter_by_type(stmts):
+    st_out = ac.filter_by_type([stmts.st1, stmts.st14], Phosphorylation)
     assert len(st_out) == 1
-    st_out = ac.filter_by_type([st1, st14], "Phosphorylation")
+    st_out = ac.filter_by_type([stmts.st1, stmts.st14], "Phosphorylation")
     assert len(st_out) == 1
 
 
-def test_filter_top_level():
-    st_out = ac.filter_top_level([st14, st15])
+def test_filter_top_level(stmts):
+    st_out = ac.filter_top_level([stmts.st14, stmts.st15])
     assert len(st_out) == 1
 
 
 def test_filter_no_hypothesis():
     a = Agent('MAPK1')
-    ev1 = Evidence(epistemics={'hypothesis': True})
-    ev2 = Evidence(epistemics={'hypothesis': False})
+    ev1 = Evidence(epistemics=_EP_HYP_T)
+    ev2 = Evidence(epistemics=_EP_HYP_F)
     st1 = Phosphorylation(None, a, evidence=[ev1, ev2])
     st2 = Phosphorylation(None, a, evidence=[ev1, ev1])
     st_out = ac.filter_no_hypothesis([st1, st2])
@@ -383,8 +455,8 @@ def test_filter_no_hypothesis():
 
 def test_filter_no_negated():
     a = Agent('MAPK1')
-    ev1 = Evidence(epistemics={'negated': True})
-    ev2 = Evidence(epistemics={'negated': False})
+    ev1 = Evidence(epistemics=_EP_NEG_T)
+    ev2 = Evidence(epistemics=_EP_NEG_F)
     st1 = Phosphorylation(None, a, evidence=[ev1, ev2])
     st2 = Phosphorylation(None, a, evidence=[ev1, ev1])
     st_out = ac.filter_no_negated([st1, st2])
@@ -401,6 +473,21 @@ def test_belief_cut_plus_filter_top():
     st_high_belief = ac.filter_belief([st1, st2], 0.5)
     st_top_level = ac.filter_top_level(st_high_belief)
     assert len(st_top_level) == 1
+    # The same criteria fused into a single pass give the same result
+    # (filter_belief above already pruned the low-belief supports)
+    st_fused = ac.filter_by_predicates(
+        [st1, st2], [ac.belief_predicate(0.5), ac.top_level_predicate()])
+    assert st_fused == st_top_level
+
+
+def test_filter_by_predicates(stmts):
+    # A single pass combining a belief cutoff with a subject requirement
+    st_out = ac.filter_by_predicates(
+        [stmts.st1, stmts.st2, stmts.st3, stmts.st5],
+        [lambda st: st.belief >= 0.75, lambda st: st.enz is not None])
+    assert len(st_out) == 2
+    assert stmts.st1 in st_out
+    assert stmts.st2 in st_out
 
 
 def test_filter_inconsequential_mods():
@@ -414,10 +501,10 @@ def test_filter_inconsequential_mods():
     assert len(st_out) == 2
 
 
-def test_filter_inconsequential_mods2():
+def test_filter_inconsequential_mods2(stmts):
     st1 = Phosphorylation(Agent('a'), Agent('b'), 'S', '315')
     whitelist = {'b': [('phosphorylation', 'S', '315')]}
-    st_out = ac.filter_inconsequential_mods([st1, st2], whitelist=whitelist)
+    st_out = ac.filter_inconsequential_mods([st1, stmts.st2], whitelist=whitelist)
     assert len(st_out) == 1
 
 
@@ -448,10 +535,10 @@ def test_filter_mutation_status():
     # Can we filter statements out based on bound conditions?
     mutations = {'BRAF': [('V', '600', 'E')]}
     deletions = []
-    braf_good_bound = deepcopy(braf_mut)
+    braf_good_bound = copy(braf_mut)
     braf_good_bound.bound_conditions = [BoundCondition(braf_mut)]
     #
-    braf_bad_bound = deepcopy(braf_mut)
+    braf_bad_bound = copy(braf_mut)
     braf_bad_bound.bound_conditions = [BoundCondition(braf_other_mut)]
     #
     st3 = Phosphorylation(braf_good_bound, Agent('a'))
@@ -573,39 +660,44 @@ def test_merge_groundings():
     assert stmts[0].obj.concept.db_refs == stmts[0].subj.concept.db_refs
 
 
-def test_preassemble_flatten():
-    st_out = ac.run_preassembly([st1, st3, st5, st6], flatten_evidence=False)
+def test_preassemble_flatten(stmts):
+    st_out = ac.run_preassembly([stmts.st1, stmts.st3, stmts.st5, stmts.st6], flatten_evidence=False)
     assert len(st_out[0].evidence) == 1
     assert len(st_out[1].evidence) == 1
-    st_out = ac.run_preassembly([st1, st3, st5, st6], flatten_evidence=True,
+    st_out = ac.run_preassembly([stmts.st1, stmts.st3, stmts.st5, stmts.st6], flatten_evidence=True,
                                 flatten_evidence_collect_from='supported_by')
     assert len(st_out[0].evidence) == 2
     assert len(st_out[1].evidence) == 2
-    st_out = ac.run_preassembly([st1, st3, st5, st6], flatten_evidence=True,
+    st_out = ac.run_preassembly([stmts.st1, stmts.st3, stmts.st5, stmts.st6], flatten_evidence=True,
                                 flatten_evidence_collect_from='supports')
     assert len(st_out[0].evidence) == 1
     assert len(st_out[1].evidence) == 1
 
 
-def test_filter_by_curation():
-    new_st1 = deepcopy(st1)
+def test_filter_by_curation(stmts):
+    new_st1 = deepcopy(stmts.st1)
     new_ev = Evidence(text='a -> b', source_api='new')
     new_st1.evidence.append(new_ev)
-    stmts_in = [new_st1, st2, st3]
+    stmts_in = [new_st1, stmts.st2, stmts.st3]
     assert len(new_st1.evidence) == 2
     assert all(st.belief != 1 for st in stmts_in)
 
-    cur1 = {'pa_hash': new_st1.get_hash(),
-            'source_hash': new_st1.evidence[0].get_source_hash(),
+    # Compute each statement/evidence hash once up front instead of
+    # re-walking the objects for every curation literal
+    new_st1_hash = new_st1.get_hash()
+    new_src0 = new_st1.evidence[0].get_source_hash()
+    new_src1 = new_st1.evidence[1].get_source_hash()
+    cur1 = {'pa_hash': new_st1_hash,
+            'source_hash': new_src0,
             'tag': 'grounding'}
-    cur2 = {'pa_hash': new_st1.get_hash(),
-            'source_hash': new_st1.evidence[1].get_source_hash(),
+    cur2 = {'pa_hash': new_st1_hash,
+            'source_hash': new_src1,
             'tag': 'wrong_relation'}
-    cur3 = {'pa_hash': new_st1.get_hash(),
-            'source_hash': new_st1.evidence[0].get_source_hash(),
+    cur3 = {'pa_hash': new_st1_hash,
+            'source_hash': new_src0,
             'tag': 'correct'}
-    cur4 = {'pa_hash': st2.get_hash(),
-            'source_hash': st2.evidence[0].get_source_hash(),
+    cur4 = {'pa_hash': stmts.st2.get_hash(),
+            'source_hash': stmts.st2.evidence[0].get_source_hash(),
             'tag': 'correct'}
     # With 'any' policy it is enough to have one incorrect curation
     any_incorrect_one_cur = ac.filter_by_curation(stmts_in, [cur1], 'any')
@@ -640,7 +732,7 @@ def test_filter_by_curation():
     # (even if the overall statement is correct according to external
     # evidence curation)
     external_ev = Evidence(text='a activates b', source_api='external')
-    external_cur = {'pa_hash': new_st1.get_hash(),
+    external_cur = {'pa_hash': new_st1_hash,
                     'source_hash': external_ev.get_source_hash(),
                     'tag': 'correct'}
     correct_external = ac.filter_by_curation(
@@ -697,11 +789,13 @@ def test_map_db_refs():
     assert regr_stmt.obj.db_refs['db2'] == 'B2'
 
 
-def test_strip_supports():
-    stmts = [deepcopy(st14), deepcopy(st15)]
-    assert stmts[0].supports
-    assert stmts[1].supported_by
-    no_support = ac.strip_supports(stmts)
+def test_strip_supports(stmts):
+    # strip_supports reassigns the supports/supported_by lists, so a
+    # shallow copy is enough to keep the fixture statements intact
+    stmts_in = [copy(stmts.st14), copy(stmts.st15)]
+    assert stmts_in[0].supports
+    assert stmts_in[1].supported_by
+    no_support = ac.strip_supports(stmts_in)
     assert not no_support[0].supports
     assert not no_support[0].supported_by
     assert not no_support[1].supports
@@ -725,7 +819,7 @@ def test_normalize_active_forms():
     stmts = [af1, af2, af3, ph, act]
     norm_stmts = ac.normalize_active_forms(stmts)
     assert len(norm_stmts) == 3
-    norm_stmt_hashes = [stmt.get_hash() for stmt in norm_stmts]
+    norm_stmt_hashes = {stmt.get_hash() for stmt in norm_stmts}
     assert af1.get_hash() in norm_stmt_hashes
     assert af3.get_hash() not in norm_stmt_hashes
     assert ph.get_hash() in norm_stmt_hashes
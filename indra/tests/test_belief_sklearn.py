@@ -1,12 +1,12 @@
 import random
 import pickle
 import numpy as np
-from copy import copy
+from scipy import sparse
+from functools import lru_cache
 from os.path import join, abspath, dirname
 from collections import defaultdict, Counter
 import pytest
 from sklearn.linear_model import LogisticRegression
-from indra.sources import signor
 from indra.belief import BeliefEngine, default_scorer
 from indra.tools import assemble_corpus as ac
 from indra.belief.skl import CountsScorer, HybridScorer
@@ -29,21 +29,36 @@ test_df_path = join(dirname(abspath(__file__)),
                     'belief_sklearn_test_df.pkl')
 
 
-with open(test_stmt_path, 'rb') as f:
-    test_stmts, y_arr_stmts = pickle.load(f)
+_fixture_paths = {'stmts': test_stmt_path,
+                  'stmts_cur': test_stmt_cur_path,
+                  'df': test_df_path}
 
 
-with open(test_stmt_cur_path, 'rb') as f:
-    test_stmts_cur, y_arr_stmts_cur = pickle.load(f)
+def _y_path(name):
+    """Return the path of the .npy class label file for a fixture."""
+    return join(dirname(abspath(__file__)),
+                'belief_sklearn_test_y_%s.npy' % name)
 
 
-with open(test_df_path, 'rb') as f:
-    test_df, y_arr_df = pickle.load(f)
+@lru_cache(maxsize=None)
+def _fixture(name):
+    """Load and cache one of the test fixtures.
+
+    Loading lazily here rather than at the top of the module means that
+    targeted test runs only load the fixtures they actually use, and a
+    full run still deserializes each file only once. The class labels
+    live in separate .npy files and are memory-mapped rather than
+    unpickled, so they cost nothing until a fit actually reads them.
+    """
+    with open(_fixture_paths[name], 'rb') as f:
+        data, _ = pickle.load(f)
+    return data, np.load(_y_path(name), mmap_mode='r')
 
 
 # A set of statements derived from Signor used for testing purposes.
 def _dump_test_data(filename, num_per_type=10):
     """Get corpus of statements for testing that has a range of stmt types."""
+    from indra.sources import signor
     sp = signor.process_from_web()
     # Group statements by type
     stmts_by_type = defaultdict(list)
@@ -60,9 +75,30 @@ def _dump_test_data(filename, num_per_type=10):
     y_arr = [random.choice((0, 1)) for s in stmt_sample]
     with open(test_stmt_path, 'wb') as f:
         pickle.dump((stmt_sample, y_arr), f)
+    np.save(_y_path('stmts'), np.asarray(y_arr, dtype=np.int8))
     return stmt_sample
 
 
+@pytest.fixture(scope='module')
+def cw_stmts_fit():
+    """Return a CountsScorer fit once on the statement fixture.
+
+    The predict tests only need a fitted model, so sharing one fit
+    avoids repeating the identical solver run per test.
+    """
+    cw = CountsScorer(LogisticRegression(), ['reach', 'sparser', 'signor'])
+    cw.fit(*_fixture('stmts'))
+    return cw
+
+
+@pytest.fixture(scope='module')
+def cw_df_fit():
+    """Return a CountsScorer fit once on the DataFrame fixture."""
+    cw = CountsScorer(LogisticRegression(), ['reach', 'sparser', 'signor'])
+    cw.fit(*_fixture('df'))
+    return cw
+
+
 def test_counts_wrapper():
     """Instantiate counts wrapper and make stmt matrix"""
     lr = LogisticRegression()
@@ -76,6 +112,7 @@ def test_counts_wrapper():
 # @raises(ValueError)
 def test_missing_source():
     """Check that all source_apis in training data are in source list."""
+    test_stmts, y_arr_stmts = _fixture('stmts')
     lr = LogisticRegression()
     source_list = ['reach', 'sparser']
     cw = CountsScorer(lr, source_list)
@@ -86,6 +123,7 @@ def test_missing_source():
 
 def test_stmts_to_matrix():
     """Check that all source_apis in training data are in source list."""
+    test_stmts, y_arr_stmts = _fixture('stmts')
     lr = LogisticRegression()
     source_list = ['reach', 'sparser', 'signor']
     cw = CountsScorer(lr, source_list)
@@ -95,29 +133,33 @@ def test_stmts_to_matrix():
             'stmt matrix dimensions should match test stmts'
     assert set(x_arr.sum(axis=0)) == set([0, 0, len(test_stmts)]), \
            'Signor col should be 1 in every row, other cols 0.'
-    # Try again with statement type
+    # Try again with statement type; the one-hot expansion makes the
+    # matrix sparse
     cw = CountsScorer(lr, source_list, use_stmt_type=True)
     num_types = len(cw.stmt_type_map)
     x_arr = cw.stmts_to_matrix(test_stmts)
+    assert sparse.issparse(x_arr), \
+        'x_arr should be sparse with stmt type one-hot columns'
     assert x_arr.shape == (len(test_stmts), len(source_list) + num_types), \
         'matrix should have a col for sources and other cols for every ' \
         'statement type.'
 
 
-def test_fit_stmts():
+@pytest.mark.parametrize('fixture_name, source_list',
+                         [('stmts', ['reach', 'sparser', 'signor']),
+                          ('df', ['reach', 'sparser', 'medscan', 'trips',
+                                  'rlimsp'])])
+def test_fit(fixture_name, source_list):
     lr = LogisticRegression()
-    source_list = ['reach', 'sparser', 'signor']
     cw = CountsScorer(lr, source_list)
-    cw.fit(test_stmts, y_arr_stmts)
+    cw.fit(*_fixture(fixture_name))
     # Once the model is fit, the coef_ attribute should be defined
     assert 'coef_' in cw.model.__dict__
 
 
-def test_fit_stmts_predict_stmts():
-    lr = LogisticRegression()
-    source_list = ['reach', 'sparser', 'signor']
-    cw = CountsScorer(lr, source_list)
-    cw.fit(test_stmts, y_arr_stmts)
+def test_fit_stmts_predict_stmts(cw_stmts_fit):
+    test_stmts, y_arr_stmts = _fixture('stmts')
+    cw = cw_stmts_fit
     probs = cw.predict_proba(test_stmts)
     assert probs.shape == (len(test_stmts), 2), \
         'prediction results should have dimension (# stmts, # classes)'
@@ -131,6 +173,7 @@ def test_fit_stmts_predict_stmts():
 
 def test_check_df_cols_err():
     """Drop a required column and make sure we get a ValueError."""
+    test_df, y_arr_df = _fixture('df')
     with pytest.raises(ValueError):
         lr = LogisticRegression()
         source_list = ['reach', 'sparser', 'signor']
@@ -140,6 +183,7 @@ def test_check_df_cols_err():
 
 def test_check_df_cols_noerr():
     """Test dataframe should not raise ValueError."""
+    test_df, y_arr_df = _fixture('df')
     lr = LogisticRegression()
     source_list = ['reach', 'sparser', 'signor']
     cw = CountsScorer(lr, source_list)
@@ -147,6 +191,7 @@ def test_check_df_cols_noerr():
 
 
 def test_df_to_matrix():
+    test_df, y_arr_df = _fixture('df')
     lr = LogisticRegression()
     source_list = ['reach', 'sparser', 'signor']
     cw = CountsScorer(lr, source_list)
@@ -155,31 +200,22 @@ def test_df_to_matrix():
     assert x_arr.shape == (len(test_df), len(source_list)), \
             'stmt matrix dimensions should match test stmts'
     assert x_arr.shape == (len(test_df), len(source_list))
-    # Try again with statement type
+    # Try again with statement type; the one-hot expansion makes the
+    # matrix sparse
     cw = CountsScorer(lr, source_list, use_stmt_type=True)
     num_types = len(cw.stmt_type_map)
     x_arr = cw.df_to_matrix(test_df)
+    assert sparse.issparse(x_arr), \
+        'x_arr should be sparse with stmt type one-hot columns'
     assert x_arr.shape == (len(test_df), len(source_list) + num_types), \
         'matrix should have a col for sources and other cols for every ' \
         'statement type.'
 
 
-def test_fit_df():
-    lr = LogisticRegression()
-    source_list = ['reach', 'sparser', 'medscan', 'trips', 'rlimsp']
-    cw = CountsScorer(lr, source_list)
-    cw.fit(test_df, y_arr_df)
-    # Once the model is fit, the coef_ attribute should be defined
-    assert 'coef_' in cw.model.__dict__
-
-
-def test_fit_stmts_pred_df():
-    lr = LogisticRegression()
-    source_list = ['reach', 'sparser', 'signor']
-    cw = CountsScorer(lr, source_list)
-    # Train on statement data
-    cw.fit(test_stmts, y_arr_stmts)
-    # Predict on DF data
+def test_fit_stmts_pred_df(cw_stmts_fit):
+    test_df, y_arr_df = _fixture('df')
+    # Trained on statement data; predict on DF data
+    cw = cw_stmts_fit
     probs = cw.predict_proba(test_df)
     assert probs.shape == (len(test_df), 2), \
         'prediction results should have dimension (# stmts, # classes)'
@@ -191,13 +227,10 @@ def test_fit_stmts_pred_df():
         'prediction results should have dimension (# stmts)'
 
 
-def test_fit_df_pred_stmts():
-    lr = LogisticRegression()
-    source_list = ['reach', 'sparser', 'signor']
-    cw = CountsScorer(lr, source_list)
-    # Train on statement data
-    cw.fit(test_df, y_arr_df)
-    # Predict on DF data
+def test_fit_df_pred_stmts(cw_df_fit):
+    test_stmts, y_arr_stmts = _fixture('stmts')
+    # Trained on DF data; predict on statement data
+    cw = cw_df_fit
     probs = cw.predict_proba(test_stmts)
     assert probs.shape == (len(test_stmts), 2), \
         'prediction results should have dimension (# stmts, # classes)'
@@ -210,6 +243,7 @@ def test_fit_df_pred_stmts():
 
 
 def test_check_missing_source_counts():
+    test_df, y_arr_df = _fixture('df')
     with pytest.raises(ValueError):
         lr = LogisticRegression()
         source_list = ['reach', 'sparser']
@@ -221,6 +255,7 @@ def test_check_missing_source_counts():
 
 
 def test_check_source_columns():
+    test_df, y_arr_df = _fixture('df')
     lr = LogisticRegression()
     source_list = ['reach', 'sparser']
     cw = CountsScorer(lr, source_list)
@@ -235,6 +270,7 @@ def test_check_source_columns():
 
 def test_matrix_to_matrix():
     """Check that we get a matrix back when passed to to_matrix."""
+    test_df, y_arr_df = _fixture('df')
     lr = LogisticRegression()
     source_list = ['reach', 'sparser', 'signor']
     cw = CountsScorer(lr, source_list)
@@ -246,6 +282,7 @@ def test_matrix_to_matrix():
 
 def test_use_members_with_df():
     """Check that we can't set use_num_members when passing a DataFrame."""
+    test_df, y_arr_df = _fixture('df')
     with pytest.raises(ValueError):
         lr = LogisticRegression()
         source_list = ['reach', 'sparser', 'signor']
@@ -257,6 +294,7 @@ def test_use_members_with_df():
 
 def test_use_members_with_stmts():
     """Check that we can set use_num_members when passing statements."""
+    test_stmts, y_arr_stmts = _fixture('stmts')
     lr = LogisticRegression()
     source_list = ['reach', 'sparser', 'signor']
     cw = CountsScorer(lr, source_list, use_num_members=True)
@@ -265,7 +303,14 @@ def test_use_members_with_stmts():
             'stmt matrix dimensions should match test stmts plus num_members'
 
 
-def setup_belief(include_more_specific=False):
+@lru_cache(maxsize=None)
+def _curated_scorer(include_more_specific=False):
+    """Return a CountsScorer fit once on the curated statement fixture.
+
+    The fitted model is deterministic and prediction does not mutate it,
+    so the setup_belief callers can share one fit per configuration.
+    """
+    test_stmts_cur, y_arr_stmts_cur = _fixture('stmts_cur')
     # Make a model
     lr = LogisticRegression()
     # Get all the sources
@@ -281,6 +326,12 @@ def setup_belief(include_more_specific=False):
         extra_evidence = None
     # Fit with extra evidence, if any
     cs.fit(test_stmts_cur, y_arr_stmts_cur, extra_evidence)
+    return cs
+
+
+def setup_belief(include_more_specific=False):
+    test_stmts_cur, y_arr_stmts_cur = _fixture('stmts_cur')
+    cs = _curated_scorer(include_more_specific)
     # Run predictions on test statements without extra evidence to get prior
     # probs
     probs = cs.predict_proba(test_stmts_cur)[:, 1]
@@ -288,26 +339,34 @@ def setup_belief(include_more_specific=False):
     # run with the belief engine:
     # Get scorer and belief engine instances for trained model
     be = BeliefEngine(scorer=cs)
-    # Make a shallow copy of the test stmts so that we don't change beliefs
-    # of the global instances as a side-effect of this test
-    test_stmts_copy = copy(test_stmts_cur)
-    return be, test_stmts_copy, probs
+    # Note that a shallow copy of the statement list would not protect
+    # the cached fixture statements: they would still be shared, so the
+    # set_*_probs calls would change their beliefs. Callers that set
+    # beliefs snapshot and restore them instead.
+    return be, test_stmts_cur, probs
 
 
 def test_set_prior_probs():
     # Get probs for a set of statements, and a belief engine instance
-    be, test_stmts_copy, probs = setup_belief()
-    # Set beliefs
-    be.set_prior_probs(test_stmts_copy)
-    beliefs = [s.belief for s in test_stmts_copy]
-    # Check that they match
-    assert np.allclose(beliefs, probs), \
-           "Statement beliefs should be set to predicted probabilities."
+    be, stmts, probs = setup_belief()
+    # Snapshot beliefs so the shared fixture statements can be restored
+    old_beliefs = [s.belief for s in stmts]
+    try:
+        # Set beliefs
+        be.set_prior_probs(stmts)
+        beliefs = [s.belief for s in stmts]
+        # Check that they match
+        assert np.allclose(beliefs, probs), \
+               "Statement beliefs should be set to predicted probabilities."
+    finally:
+        for s, b in zip(stmts, old_beliefs):
+            s.belief = b
 
 
 def test_df_extra_ev_value_error():
     """to_matrix should raise NotImplementError if given a DataFrame and extra
        evidence (for now)."""
+    test_df, y_arr_df = _fixture('df')
     with pytest.raises(NotImplementedError):
         lr = LogisticRegression()
         source_list = ['reach', 'sparser', 'signor']
@@ -318,6 +377,7 @@ def test_df_extra_ev_value_error():
 def test_extra_evidence_length():
     """Should raise ValueError because the extra_evidence list is not the
     same length as the list of statements."""
+    test_stmts, y_arr_stmts = _fixture('stmts')
     with pytest.raises(ValueError):
         lr = LogisticRegression()
         source_list = ['reach', 'sparser', 'signor']
@@ -329,6 +389,7 @@ def test_extra_evidence_length():
 def test_extra_evidence_content():
     """Should raise ValueError if extra_evidence list entries are not
     Evidence objects or empty lists."""
+    test_stmts, y_arr_stmts = _fixture('stmts')
     with pytest.raises(ValueError):
         lr = LogisticRegression()
         source_list = ['reach', 'sparser', 'signor']
@@ -339,34 +400,45 @@ def test_extra_evidence_content():
 
 def test_set_hierarchy_probs():
     # Get probs for a set of statements, and a belief engine instance
-    be, test_stmts_copy, prior_probs = setup_belief(include_more_specific=True)
-    # Set beliefs on the flattened statements
-    top_level = ac.filter_top_level(test_stmts_copy)
-    be.set_hierarchy_probs(test_stmts_copy)
-    # Compare hierarchy probs to prior probs
-    for stmt, prior_prob in zip(test_stmts_copy, prior_probs):
-        # Check that the top-level statements beliefs have not changed
-        if stmt in top_level:
-            assert stmt.belief == prior_prob
-        # We expect the belief to change if including more evidence
-        else:
-            assert stmt.belief != prior_prob
+    be, stmts, prior_probs = setup_belief(include_more_specific=True)
+    old_beliefs = [s.belief for s in stmts]
+    try:
+        # Set beliefs on the flattened statements
+        top_level = ac.filter_top_level(stmts)
+        be.set_hierarchy_probs(stmts)
+        # Compare hierarchy probs to prior probs
+        for stmt, prior_prob in zip(stmts, prior_probs):
+            # Check that the top-level statements beliefs have not changed
+            if stmt in top_level:
+                assert stmt.belief == prior_prob
+            # We expect the belief to change if including more evidence
+            else:
+                assert stmt.belief != prior_prob
+    finally:
+        for s, b in zip(stmts, old_beliefs):
+            s.belief = b
 
 
 def test_set_hierarchy_probs_specific_false():
     # Get probs for a set of statements, and a belief engine instance
-    be, test_stmts_copy, prior_probs = setup_belief(include_more_specific=False)
-    # Set beliefs on the flattened statements
-    top_level = ac.filter_top_level(test_stmts_copy)
-    be.set_hierarchy_probs(test_stmts_copy)
-    # Compare hierarchy probs to prior probs
-    for stmt, prior_prob in zip(test_stmts_copy, prior_probs):
-        # Because we haven't included any supports, the beliefs should
-        # not have changed
-        assert stmt.belief == prior_prob
+    be, stmts, prior_probs = setup_belief(include_more_specific=False)
+    old_beliefs = [s.belief for s in stmts]
+    try:
+        # Set beliefs on the flattened statements
+        top_level = ac.filter_top_level(stmts)
+        be.set_hierarchy_probs(stmts)
+        # Compare hierarchy probs to prior probs
+        for stmt, prior_prob in zip(stmts, prior_probs):
+            # Because we haven't included any supports, the beliefs should
+            # not have changed
+            assert stmt.belief == prior_prob
+    finally:
+        for s, b in zip(stmts, old_beliefs):
+            s.belief = b
 
 
 def test_hybrid_scorer():
+    test_stmts_cur, y_arr_stmts_cur = _fixture('stmts_cur')
     # First instantiate and train the SimpleScorer on readers
     # Make a model
     lr = LogisticRegression()
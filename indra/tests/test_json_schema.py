@@ -1,13 +1,7 @@
-import json
-import jsonschema
-import os
 import pytest
 from jsonschema.exceptions import ValidationError
 
-dir_this = os.path.dirname(__file__)
-schema_file = os.path.join(dir_this, '../resources/statements_schema.json')
-with open(schema_file, 'r') as f:
-    schema = json.loads(f.read())
+from indra.statements.json_schema import VALIDATOR
 
 valid_agent1 = {'name': 'RAF', 'db_refs': {'TEXT': 'RAF'}}
 valid_agent2 = {'name': 'RAS', 'db_refs': {'TEXT': 'RAS'}}
@@ -47,7 +41,7 @@ invalid_concept2 = {'name': 'government'}
 
 
 def val(s):
-    jsonschema.validate([s], schema)
+    VALIDATOR.validate([s])
 
 
 def test_valid_modification():
@@ -66,24 +60,24 @@ def test_valid_modification():
     for mod_type in mod_types:
         s = {'enz': valid_agent1, 'sub': valid_agent2,
              'type': mod_type, 'id': '5'}
-        jsonschema.validate([s], schema)
+        VALIDATOR.validate([s])
 
         s['enz'] = agent_mod
-        jsonschema.validate([s], schema)
+        VALIDATOR.validate([s])
 
         s['enz'] = agent_mut
-        jsonschema.validate([s], schema)
+        VALIDATOR.validate([s])
 
         s['enz'] = agent_act
-        jsonschema.validate([s], schema)
+        VALIDATOR.validate([s])
 
         if mod_type not in ['Activation', 'Inhibition', 'IncreaseAmount',
                             'DecreaseAmount']:
             s['residue'] = 'S'
-            jsonschema.validate([s], schema)
+            VALIDATOR.validate([s])
 
             s['position'] = '10'
-            jsonschema.validate([s], schema)
+            VALIDATOR.validate([s])
 
 
 def test_invalid_phosphorylation():
@@ -115,7 +109,7 @@ def test_invalid_phosphorylation():
 def test_valid_active_form():
     s = {'agent': valid_agent1, 'activity': 'kinase', 'is_active': True,
          'type': 'ActiveForm', 'id': '6'}
-    jsonschema.validate([s], schema)
+    VALIDATOR.validate([s])
 
 
 def test_invalid_active_form():
@@ -147,10 +141,10 @@ def test_invalid_active_form():
 
 def test_valid_complex():
     s = {'members': [valid_agent1, valid_agent2], 'type': 'Complex', 'id': '3'}
-    jsonschema.validate([s], schema)
+    VALIDATOR.validate([s])
 
     s = {'members': [], 'type': 'Complex', 'id': '3'}
-    jsonschema.validate([s], schema)
+    VALIDATOR.validate([s])
 
 
 def test_invalid_complex():
@@ -166,13 +160,13 @@ def test_invalid_complex():
 
 
 def test_valid_event():
-    jsonschema.validate([valid_event1], schema)
+    VALIDATOR.validate([valid_event1])
 
 
 def test_valid_influence():
     s = {'subj': valid_event1, 'obj': valid_event2, 'subj_delta': None,
          'obj_delta': None, 'type': 'Influence', 'id': '10'}
-    jsonschema.validate([s], schema)
+    VALIDATOR.validate([s])
 
 
 def test_invalid_influence():
@@ -205,7 +199,7 @@ def test_invalid_influence():
 def test_valid_conversion():
     s = {'type': 'Conversion', 'id': '11', 'subj': valid_agent1,
          'obj_from': [valid_agent2, valid_agent3], 'obj_to': [valid_agent3]}
-    jsonschema.validate([s], schema)
+    VALIDATOR.validate([s])
 
 
 def test_invalid_conversion():
@@ -235,24 +229,24 @@ def test_self_modifications():
     self_mods = ['Autophosphorylation', 'Transphosphorylation']
     for self_mod in self_mods:
         s = {'type': self_mod, 'id': '20', 'enz': valid_agent1}
-        jsonschema.validate([s], schema)
+        VALIDATOR.validate([s])
 
         s['residue'] = 'S'
-        jsonschema.validate([s], schema)
+        VALIDATOR.validate([s])
 
         s['position'] = '10'
-        jsonschema.validate([s], schema)
+        VALIDATOR.validate([s])
 
 
 def test_translocation():
     s = {'type': 'Translocation', 'id': '30', 'agent': valid_agent1}
-    jsonschema.validate([s], schema)
+    VALIDATOR.validate([s])
 
     s['from_location'] = 'A'
-    jsonschema.validate([s], schema)
+    VALIDATOR.validate([s])
 
     s['to_location'] = 'B'
-    jsonschema.validate([s], schema)
+    VALIDATOR.validate([s])
 
     s['to_location'] = 3
     with pytest.raises(ValidationError):
@@ -261,9 +255,9 @@ def test_translocation():
 
 def test_gef():
     s = {'type': 'Gef', 'id': '40', 'gef': valid_agent1, 'ras': valid_agent2}
-    jsonschema.validate([s], schema)
+    VALIDATOR.validate([s])
 
 
 def test_gap():
     s = {'type': 'Gap', 'id': '41', 'gap': valid_agent1, 'ras': valid_agent2}
-    jsonschema.validate([s], schema)
+    VALIDATOR.validate([s])
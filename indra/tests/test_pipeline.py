@@ -1,10 +1,9 @@
 import unittest
 from indra.pipeline import AssemblyPipeline, RunnableArgument
 from indra.pipeline.pipeline import jsonify_arg_input
-from indra.tests.test_assemble_corpus import st1, st2, st3, st4
 from indra.tools.assemble_corpus import *
 from indra.belief import BeliefScorer
-from indra.statements import Activation
+from indra.statements import Activation, Agent, Evidence, Phosphorylation
 try:
     from indra_world.assembly.matches import location_matches
     from indra_world.assembly.refinement import location_refinement
@@ -15,7 +14,24 @@ except ImportError:
     has_indra_world = False
 
 
-stmts = [st1, st2, st3, st4]
+# A small statement corpus for running pipelines on: two statements with
+# grounded agents on both sides and two with an ungrounded (TEXT-only)
+# agent, so grounding-based filters have something to remove
+_a = Agent('a', db_refs={'HGNC': '1234', 'TEXT': 'a'})
+_b = Agent('b', db_refs={'UP': 'P15056', 'TEXT': 'b'})
+_c = Agent('c', db_refs={'FPLX': 'XXX', 'TEXT': 'c'})
+_d = Agent('d', db_refs={'TEXT': 'd'})
+_e = Agent('e', db_refs={'CHEBI': 'CHEBI:1234', 'TEXT': 'e'})
+stmts = [
+    Phosphorylation(_a, _b,
+                    evidence=[Evidence(text='a->b', source_api='assertion')]),
+    Phosphorylation(_a, _d,
+                    evidence=[Evidence(text='a->d', source_api='assertion')]),
+    Phosphorylation(_c, _d,
+                    evidence=[Evidence(text='c->d', source_api='assertion')]),
+    Phosphorylation(_b, _e,
+                    evidence=[Evidence(text='b->e', source_api='assertion')]),
+]
 path_this = os.path.dirname(os.path.abspath(__file__))
 test_json = os.path.join(path_this, 'pipeline_test.json')
 
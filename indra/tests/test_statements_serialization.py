@@ -2,9 +2,8 @@ from __future__ import absolute_import, print_function, unicode_literals
 from builtins import dict, str
 import json
 import datetime
-import jsonschema
 from indra.statements import *
-from .test_json_schema import schema
+from indra.statements.json_schema import VALIDATOR
 
 ev = Evidence(source_api='bel', pmid='12345', epistemics={'direct': True},
               text='This is the evidence.')
@@ -29,7 +28,7 @@ def test_agent_mod_condition():
 def test_modification():
     stmt = Phosphorylation(Agent('a'), Agent('b'), 'S', evidence=[ev])
     jd = stmt.to_json()
-    jsonschema.validate([jd], schema)
+    VALIDATOR.validate([jd])
     stmt.to_graph()
     jd2 = Statement._from_json(jd).to_json()
     assert jd == jd2
@@ -38,7 +37,7 @@ def test_modification():
 def test_selfmodification():
     stmt = Autophosphorylation(Agent('a'), 'Y', '1234', evidence=[ev])
     jd = stmt.to_json()
-    jsonschema.validate([jd], schema)
+    VALIDATOR.validate([jd])
     stmt.to_graph()
     jd2 = Statement._from_json(jd).to_json()
     assert jd == jd2
@@ -47,7 +46,7 @@ def test_selfmodification():
 def test_activation():
     stmt = Activation(Agent('a'), Agent('b'), 'kinase', evidence=[ev])
     jd = stmt.to_json()
-    jsonschema.validate([jd], schema)
+    VALIDATOR.validate([jd])
     stmt.to_graph()
     jd2 = Statement._from_json(jd).to_json()
     assert jd == jd2
@@ -56,7 +55,7 @@ def test_activation():
 def test_amount():
     stmt = IncreaseAmount(Agent('a'), Agent('b'), evidence=[ev])
     jd = stmt.to_json()
-    jsonschema.validate([jd], schema)
+    VALIDATOR.validate([jd])
     stmt.to_graph()
     jd2 = Statement._from_json(jd).to_json()
     assert jd == jd2
@@ -66,7 +65,7 @@ def test_active_form():
     stmt = ActiveForm(Agent('a', location='nucleus'), 'kinase', False,
                       evidence=[ev])
     jd = stmt.to_json()
-    jsonschema.validate([jd], schema)
+    VALIDATOR.validate([jd])
     stmt.to_graph()
     jd2 = Statement._from_json(jd).to_json()
     assert jd == jd2
@@ -75,7 +74,7 @@ def test_active_form():
 def test_complex():
     stmt = Complex([Agent('a'), Agent('b')], evidence=[ev])
     jd = stmt.to_json()
-    jsonschema.validate([jd], schema)
+    VALIDATOR.validate([jd])
     stmt.to_graph()
     jd2 = Statement._from_json(jd).to_json()
     assert jd == jd2
@@ -84,7 +83,7 @@ def test_complex():
 def test_translocation():
     stmt = Translocation(Agent('a'), 'cytoplasm', 'nucleus', evidence=[ev])
     jd = stmt.to_json()
-    jsonschema.validate([jd], schema)
+    VALIDATOR.validate([jd])
     stmt.to_graph()
     jd2 = Statement._from_json(jd).to_json()
     assert jd == jd2
@@ -93,7 +92,7 @@ def test_translocation():
 def test_gap():
     stmt = Gap(Agent('a'), Agent('b'), evidence=[ev])
     jd = stmt.to_json()
-    jsonschema.validate([jd], schema)
+    VALIDATOR.validate([jd])
     stmt.to_graph()
     jd2 = Statement._from_json(jd).to_json()
     assert jd == jd2
@@ -102,7 +101,7 @@ def test_gap():
 def test_gef():
     stmt = Gef(Agent('a'), Agent('b'), evidence=[ev])
     jd = stmt.to_json()
-    jsonschema.validate([jd], schema)
+    VALIDATOR.validate([jd])
     stmt.to_graph()
     jd2 = Statement._from_json(jd).to_json()
     assert jd == jd2
@@ -116,7 +115,7 @@ def test_influence():
                 delta=QualitativeDelta(polarity=1, adjectives=['significant']))
     stmt = Influence(ev1, ev2)
     jd = stmt.to_json()
-    jsonschema.validate([jd], schema)
+    VALIDATOR.validate([jd])
     assert 'sbo' not in jd['subj']
     assert 'sbo' not in jd['obj']
     stmt.to_graph()
@@ -127,7 +126,7 @@ def test_influence():
         st_deserialize.subj.context
     jd2 = st_deserialize.to_json()
     assert jd == jd2, (jd, jd2)
-    jsonschema.validate([json.loads(json.dumps(jd))], schema)
+    VALIDATOR.validate([json.loads(json.dumps(jd))])
 
 
 def test_association():
@@ -382,17 +381,19 @@ def test_evidence_context():
     assert ev.to_json() == Evidence._from_json(ev.to_json()).to_json()
 
 
-def test_file_serialization():
+def test_file_serialization(tmp_path):
+    path = tmp_path / 'test_indra_stmts.json'
     stmt = IncreaseAmount(Agent('a'), Agent('b'), evidence=[ev])
-    stmts_to_json_file([stmt], 'test_indra_stmts.json')
-    stmts = stmts_from_json_file('test_indra_stmts.json')
+    stmts_to_json_file([stmt], path)
+    stmts = stmts_from_json_file(path)
     assert stmts[0].matches(stmt)
 
 
-def test_file_serialization_json_lines():
+def test_file_serialization_json_lines(tmp_path):
+    path = tmp_path / 'test_indra_stmts.json'
     stmt = IncreaseAmount(Agent('a'), Agent('b'), evidence=[ev])
-    stmts_to_json_file([stmt], 'test_indra_stmts.json', format='jsonl')
-    stmts = stmts_from_json_file('test_indra_stmts.json', format='jsonl')
+    stmts_to_json_file([stmt], path, format='jsonl')
+    stmts = stmts_from_json_file(path, format='jsonl')
     assert stmts[0].matches(stmt)
 
 
@@ -10,20 +10,20 @@ except ImportError:
     import pickle
 
 import logging
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 from typing import List
 from collections import defaultdict
 from copy import deepcopy, copy
+from functools import lru_cache
 from indra.statements import *
 from indra.belief import BeliefEngine
 from indra.util import read_unicode_csv
 from indra.pipeline import register_pipeline
-from indra.mechlinker import MechLinker
-from indra.databases import hgnc_client
-from indra.ontology.bio import bio_ontology
-from indra.preassembler import Preassembler, flatten_evidence
 from indra.resources import get_resource_path
 from indra.statements.validate import print_validation_report
-import indra.tools.fix_invalidities
 
 
 logger = logging.getLogger(__name__)
@@ -34,7 +34,7 @@ def _filter(kwargs, arg_list):
 
 
 @register_pipeline
-def dump_statements(stmts_in, fname, protocol=4):
+def dump_statements(stmts_in, fname, protocol=pickle.HIGHEST_PROTOCOL):
     """Dump a list of statements into a pickle file.
 
     Parameters
@@ -43,7 +43,7 @@ def dump_statements(stmts_in, fname, protocol=4):
         The name of the pickle file to dump statements into.
     protocol : Optional[int]
         The pickle protocol to use (use 2 for Python 2 compatibility).
-        Default: 4
+        Default: pickle.HIGHEST_PROTOCOL
     """
     logger.info('Dumping %d statements into %s...' % (len(stmts_in), fname))
     with open(fname, 'wb') as fh:
@@ -89,6 +89,57 @@ def load_statements(fname, as_dict=False):
     return stmts
 
 
+@register_pipeline
+def dump_statements_fast(stmts_in, fname):
+    """Dump a list of statements into a msgpack file.
+
+    Statements are serialized into their JSON representation and written
+    as a stream of msgpack objects, which is typically faster to write
+    and read back than a pickle of the statement objects. Requires the
+    optional msgpack package to be installed.
+
+    Parameters
+    ----------
+    stmts_in : list[indra.statements.Statement]
+        A list of statements to dump.
+    fname : str
+        The name of the msgpack file to dump statements into.
+    """
+    if msgpack is None:
+        raise ImportError('dump_statements_fast requires the msgpack '
+                          'package to be installed.')
+    logger.info('Dumping %d statements into %s...' % (len(stmts_in), fname))
+    packer = msgpack.Packer(use_bin_type=True)
+    with open(fname, 'wb') as fh:
+        for stmt in stmts_in:
+            fh.write(packer.pack(stmt.to_json()))
+    return stmts_in
+
+
+def load_statements_fast(fname):
+    """Load statements from a msgpack file written by dump_statements_fast.
+
+    Parameters
+    ----------
+    fname : str
+        The name of the msgpack file to load statements from.
+
+    Returns
+    -------
+    stmts : list[indra.statements.Statement]
+        A list of statements that were loaded.
+    """
+    if msgpack is None:
+        raise ImportError('load_statements_fast requires the msgpack '
+                          'package to be installed.')
+    logger.info('Loading %s...' % fname)
+    with open(fname, 'rb') as fh:
+        unpacker = msgpack.Unpacker(fh, raw=False)
+        stmts = stmts_from_json(list(unpacker))
+    logger.info('Loaded %d statements' % len(stmts))
+    return stmts
+
+
 @register_pipeline
 def map_grounding(stmts_in, do_rename=True, grounding_map=None,
                   misgrounding_map=None, agent_map=None, ignores=None, use_adeft=True,
@@ -213,13 +264,16 @@ def merge_groundings(stmts_in):
             # 1. All the entries in the list are scored in which case we
             # get unique entries and sort them by score
             if all([isinstance(v, (tuple, list)) for v in values]):
-                best_groundings[ns] = []
-                for unique_value in {v[0] for v in values}:
-                    scores = [v[1] for v in values if v[0] == unique_value]
-                    best_groundings[ns].append((unique_value, max(scores)))
-
+                # Take the maximum score for each unique entry in a
+                # single pass rather than rescanning the value list
+                # once per unique entry
+                max_scores = {}
+                for value, score in values:
+                    cur_score = max_scores.get(value)
+                    if cur_score is None or score > cur_score:
+                        max_scores[value] = score
                 best_groundings[ns] = \
-                    sorted(best_groundings[ns], key=lambda x: x[1],
+                    sorted(max_scores.items(), key=lambda x: x[1],
                            reverse=True)
             # 2. All the entries in the list are unscored in which case we
             # get the highest frequency entry
@@ -381,8 +435,13 @@ def run_preassembly(stmts_in, return_toplevel=True, poolsize=None,
     stmts_out : list[indra.statements.Statement]
         A list of preassembled top-level statements.
     """
+    from indra.preassembler import Preassembler
     dump_pkl_unique = kwargs.get('save_unique')
-    use_ontology = ontology if ontology is not None else bio_ontology
+    if ontology is not None:
+        use_ontology = ontology
+    else:
+        from indra.ontology.bio import bio_ontology
+        use_ontology = bio_ontology
     be = BeliefEngine(scorer=belief_scorer, matches_fun=matches_fun)
     pa = Preassembler(use_ontology, stmts_in, matches_fun=matches_fun,
                       refinement_fun=refinement_fun)
@@ -488,6 +547,7 @@ def run_preassembly_related(preassembler, beliefengine, **kwargs):
     # Flatten evidence if needed
     do_flatten_evidence = kwargs.get('flatten_evidence', False)
     if do_flatten_evidence:
+        from indra.preassembler import flatten_evidence
         flatten_evidences_collect_from = \
             kwargs.get('flatten_evidence_collect_from', 'supported_by')
         stmts_out = flatten_evidence(stmts_out, flatten_evidences_collect_from)
@@ -549,30 +609,27 @@ def filter_by_type(stmts_in, stmt_type, invert=False, **kwargs):
 
 
 def _agent_is_grounded(agent, score_threshold):
-    grounded = True
-    db_names = list(set(agent.db_refs.keys()) - set(['TEXT', 'TEXT_NORM']))
+    db_refs = agent.db_refs
+    db_names = [db_name for db_name in db_refs
+                if db_name not in ('TEXT', 'TEXT_NORM')]
     # If there are no entries at all other than possibly TEXT
     if not db_names:
-        grounded = False
+        return False
     # If there are entries but they point to None / empty values
-    if not any([agent.db_refs[db_name] for db_name in db_names]):
-        grounded = False
+    if not any(db_refs[db_name] for db_name in db_names):
+        return False
     # If we are looking for scored groundings with a threshold
     if score_threshold:
-        any_passing = False
         for db_name in db_names:
-            val = agent.db_refs[db_name]
+            val = db_refs[db_name]
             # If it's a list with some values, find the
             # highest scoring match and compare to threshold
             if isinstance(val, list) and val:
-                high_score = sorted(val, key=lambda x: x[1],
-                                    reverse=True)[0][1]
+                high_score = max(entry[1] for entry in val)
                 if high_score > score_threshold:
-                    any_passing = True
-                    break
-        if not any_passing:
-            grounded = False
-    return grounded
+                    return True
+        return False
+    return True
 
 
 def _remove_bound_conditions(agent, keep_criterion):
@@ -645,11 +702,11 @@ def filter_grounded_only(stmts_in, score_threshold=None, remove_bound=False,
     logger.info('Filtering %d statements for grounded agents...' % 
                 len(stmts_in))
     stmts_out = []
+    criterion = lambda x: _agent_is_grounded(x, score_threshold)
     for st in stmts_in:
         grounded = True
         for agent in st.agent_list():
             if agent is not None:
-                criterion = lambda x: _agent_is_grounded(x, score_threshold)
                 if not criterion(agent):
                     grounded = False
                     break
@@ -804,7 +861,7 @@ def filter_gene_list(stmts_in, gene_list, policy, allow_families=False,
     stmts_in : list[indra.statements.Statement]
         A list of statements to filter.
     gene_list : list[str]
-        A list of gene symbols to filter for.
+        A list (or set) of gene symbols to filter for.
     policy : str
         The policy to apply when filtering for the list of genes. "one": keep
         statements that contain at least one of the list of genes and
@@ -839,8 +896,10 @@ def filter_gene_list(stmts_in, gene_list, policy, allow_families=False,
 
     # If we're allowing families, make a list of all FamPlex IDs that
     # contain members of the gene list, and add them to the filter list
-    filter_list = copy(gene_list)
+    filter_list = list(gene_list)
     if allow_families:
+        from indra.databases import hgnc_client
+        from indra.ontology.bio import bio_ontology
         for hgnc_name in gene_list:
             hgnc_id = hgnc_client.get_hgnc_id(hgnc_name)
             if not hgnc_id:
@@ -849,6 +908,9 @@ def filter_gene_list(stmts_in, gene_list, policy, allow_families=False,
             parents = bio_ontology.get_parents('HGNC', hgnc_id)
             filter_list += [db_id for db_ns, db_id in parents
                             if db_ns == 'FPLX']
+    # Set membership makes the per-agent name checks O(1) even for
+    # large gene lists
+    filter_list = frozenset(filter_list)
     stmts_out = []
 
     if remove_bound:
@@ -910,7 +972,7 @@ def filter_concept_names(stmts_in, name_list, policy, invert=False, **kwargs):
     stmts_in : list[indra.statements.Statement]
         A list of Statements to filter.
     name_list : list[str]
-        A list of concept/agent names to filter for.
+        A list (or set) of concept/agent names to filter for.
     policy : str
         The policy to apply when filtering for the list of names. "one": keep
         Statements that contain at least one of the list of names and
@@ -935,6 +997,7 @@ def filter_concept_names(stmts_in, name_list, policy, invert=False, **kwargs):
         logger.info(('Filtering %d statements for ones %scontaining "%s" of: '
                      '%s...') % (len(stmts_in), inv_str, policy, name_str))
 
+    name_set = frozenset(name_list)
     stmts_out = []
 
     if policy == 'one':
@@ -943,7 +1006,7 @@ def filter_concept_names(stmts_in, name_list, policy, invert=False, **kwargs):
             agent_list = st.agent_list()
             for agent in agent_list:
                 if agent is not None:
-                    if agent.name in name_list:
+                    if agent.name in name_set:
                         found = True
                         break
             if (found and not invert) or (not found and invert):
@@ -954,7 +1017,7 @@ def filter_concept_names(stmts_in, name_list, policy, invert=False, **kwargs):
             agent_list = st.agent_list()
             for agent in agent_list:
                 if agent is not None:
-                    if agent.name not in name_list:
+                    if agent.name not in name_set:
                         found = False
                         break
             if (found and not invert) or (not found and invert):
@@ -1074,9 +1137,13 @@ def filter_human_only(stmts_in, remove_bound=False, **kwargs):
                 len(stmts_in))
     stmts_out = []
 
+    # The same handful of UniProt IDs tends to recur across a corpus, so
+    # the lookup result is cached per ID for the duration of the run.
+    is_human = lru_cache(maxsize=10000)(uniprot_client.is_human)
+
     def criterion(agent):
         upid = agent.db_refs.get('UP')
-        if upid and not uniprot_client.is_human(upid):
+        if upid and not is_human(upid):
             return False
         else:
             return True
@@ -1338,6 +1405,10 @@ def filter_inconsequential_mods(stmts_in, whitelist=None, **kwargs):
                             states_used[agent.name] = [mod]
     for k, v in states_used.items():
         states_used[k] = list(set(v))
+    # Set views of the used sites make the per-statement check below a
+    # hash lookup instead of a list scan
+    used_sets = {name: set(map(tuple, mods))
+                 for name, mods in states_used.items()}
     stmts_out = []
     for stmt in stmts_in:
         skip = False
@@ -1346,7 +1417,7 @@ def filter_inconsequential_mods(stmts_in, whitelist=None, **kwargs):
             if isinstance(stmt, RemoveModification):
                 mod_type = modtype_to_inverse[mod_type]
             mod = (mod_type, stmt.residue, stmt.position)
-            used = states_used.get(stmt.sub.name, [])
+            used = used_sets.get(stmt.sub.name, ())
             if mod not in used:
                 skip = True
         if not skip:
@@ -1401,11 +1472,14 @@ def filter_inconsequential_acts(stmts_in, whitelist=None, **kwargs):
                         states_used[agent.name] = [act]
     for k, v in states_used.items():
         states_used[k] = list(set(v))
+    # Set views of the used activity types make the per-statement check
+    # below a hash lookup instead of a list scan
+    used_sets = {name: set(acts) for name, acts in states_used.items()}
     stmts_out = []
     for stmt in stmts_in:
         skip = False
         if isinstance(stmt, RegulateActivity):
-            used = states_used.get(stmt.obj.name, [])
+            used = used_sets.get(stmt.obj.name, ())
             if stmt.obj_activity not in used:
                 skip = True
         if not skip:
@@ -1665,6 +1739,80 @@ def filter_uuid_list(stmts_in, uuids, invert=True, **kwargs):
     return stmts_out
 
 
+@register_pipeline
+def filter_by_predicates(stmts_in, predicates, **kwargs):
+    """Filter to statements that satisfy all given predicates in one pass.
+
+    This is useful to combine multiple filtering criteria without
+    traversing the statement list once per criterion: each statement is
+    visited a single time and the predicates are evaluated with
+    short-circuiting in the order given.
+
+    Parameters
+    ----------
+    stmts_in : list[indra.statements.Statement]
+        A list of statements to filter.
+    predicates : list[function]
+        A list of functions taking a Statement and returning True if the
+        statement should be kept.
+    save : Optional[str]
+        The name of a pickle file to save the results (stmts_out) into.
+
+    Returns
+    -------
+    stmts_out : list[indra.statements.Statement]
+        A list of filtered statements.
+    """
+    logger.info('Filtering %d statements with %d predicates...' %
+                (len(stmts_in), len(predicates)))
+    stmts_out = [st for st in stmts_in
+                 if all(pred(st) for pred in predicates)]
+    logger.info('%d statements after filter...' % len(stmts_out))
+    dump_pkl = kwargs.get('save')
+    if dump_pkl:
+        dump_statements(stmts_out, dump_pkl)
+    return stmts_out
+
+
+def belief_predicate(belief_cutoff):
+    """Return a predicate keeping statements above a given belief.
+
+    Using this with filter_by_predicates fuses the belief cutoff with
+    other criteria into a single pass over the statements. Note that
+    unlike filter_belief, the predicate does not prune the supports and
+    supported_by lists of the statements that are kept.
+
+    Parameters
+    ----------
+    belief_cutoff : float
+        Only statements with belief at or above the belief_cutoff
+        satisfy the predicate.
+
+    Returns
+    -------
+    function
+        A predicate taking a Statement and returning True if its belief
+        is at or above the cutoff.
+    """
+    return lambda st: st.belief >= belief_cutoff
+
+
+def top_level_predicate():
+    """Return a predicate keeping statements at the top of the hierarchy.
+
+    Using this with filter_by_predicates fuses the top-level criterion
+    of filter_top_level with other criteria into a single pass over the
+    statements.
+
+    Returns
+    -------
+    function
+        A predicate taking a Statement and returning True if it does
+        not support any other statement.
+    """
+    return lambda st: not st.supports
+
+
 @register_pipeline
 def filter_by_curation(stmts_in, curations, incorrect_policy='any',
                        correct_tags=None, update_belief=True):
@@ -1788,6 +1936,7 @@ def expand_families(stmts_in, **kwargs):
         A list of expanded statements.
     """
     from indra.tools.expand_families import Expander
+    from indra.ontology.bio import bio_ontology
     logger.info('Expanding families on %d statements...' % len(stmts_in))
     expander = Expander(bio_ontology)
     stmts_out = expander.expand_families(stmts_in)
@@ -1814,6 +1963,7 @@ def reduce_activities(stmts_in, **kwargs):
     stmts_out : list[indra.statements.Statement]
         A list of reduced activity statements.
     """
+    from indra.mechlinker import MechLinker
     logger.info('Reducing activities on %d statements...' % len(stmts_in))
     stmts_out = [deepcopy(st) for st in stmts_in]
     ml = MechLinker(stmts_out)
@@ -2139,6 +2289,7 @@ def run_mechlinker(
     list[indra.statements.Statement]
         A list of INDRA Statements that have gone through mechanism linking.
     """
+    from indra.mechlinker import MechLinker
     ml = MechLinker(stmts_in)
     if reduce_activities:
         if implicit:
@@ -2251,6 +2402,7 @@ def fix_invalidities(stmts: List[Statement],
     if print_report_before:
         logger.info('Any invalidities detected before fixing are printed below')
         print_validation_report(stmts)
+    import indra.tools.fix_invalidities
     if not in_place:
         logger.info('Making deepcopy of statements')
         stmts = deepcopy(stmts)
@@ -39,6 +39,7 @@ def main():
                       'api': ['flask<2.0', 'flask_restx<0.4', 'flask_cors',
                               'docstring-parser', 'gunicorn'],
                       'sklearn_belief': ['scikit-learn'],
+                      'msgpack': ['msgpack'],
                       'owl': ['pronto'],
                       'tests': ['pytest', 'pytest-cov'],
                       }